@@ -11,7 +11,7 @@ from pipelines.docx_pipeline import process_docx_file
 from pipelines.pdf_pipeline import process_pdf_file
 from report.report_exporter import export_html_side_by_side
 from report.ui_payload import build_review_payload, save_json
-from policy.audit_log import append_audit_log
+from policy.audit_log import AuditLogWriter
 
 
 @dataclass
@@ -33,6 +33,10 @@ def _ensure_dirs(base_dir: str) -> Dict[str, str]:
     return {"out": out_dir, "backup": backup_dir}
 
 
+# ".." and every character Windows forbids in file names (plus control chars)
+_UNSAFE_RE = re.compile(r'\.\.|[<>:"/\\|?*\x00-\x1f]')
+
+
 def _safe_basename(path: str) -> str:
     r"""Return a filesystem-safe basename for outputs.
 
@@ -40,15 +44,52 @@ def _safe_basename(path: str) -> str:
     Also strips control chars and collapses dangerous sequences.
     """
     b = os.path.basename(path)
-    b = b.replace("..", "_").replace("/", "_").replace("\\", "_")
-    b = re.sub(r'[<>:"/\\|?*]', "_", b)
-    b = re.sub(r"[\x00-\x1f]", "_", b)
+    b = _UNSAFE_RE.sub("_", b)
     b = b.rstrip(" .")
     if not b:
         b = "document"
     return b
 
 
+def _kernel_copy(src: str, dst: str, use_copy_file_range: bool) -> bool:
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(in_fd).st_size
+        while remaining > 0:
+            if use_copy_file_range:
+                n = os.copy_file_range(in_fd, out_fd, remaining)
+            else:
+                n = os.sendfile(out_fd, in_fd, None, remaining)
+            if n == 0:
+                return False
+            remaining -= n
+    return True
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """shutil.copy2 equivalent that lets the kernel copy the bytes.
+
+    Tries os.copy_file_range (Linux, can reflink), then os.sendfile, then
+    shutil.copyfile. Metadata is copied with shutil.copystat like copy2.
+    """
+    copied = False
+    for use_cfr, name in ((True, "copy_file_range"), (False, "sendfile")):
+        if not hasattr(os, name):
+            continue
+        try:
+            copied = _kernel_copy(src, dst, use_cfr)
+        except OSError:
+            copied = False
+        if copied:
+            break
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+_CSV_BATCH_ROWS = 10000
+
+
 def _export_hits_csv(hits: List[Dict[str, Any]], out_path: str) -> None:
     """Export detection hits to CSV for external audit/review."""
     os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
@@ -56,11 +97,17 @@ def _export_hits_csv(hits: List[Dict[str, Any]], out_path: str) -> None:
         "entity_type", "start", "end", "original",
         "replacement", "score", "reason", "source",
     ]
-    with open(out_path, "w", encoding="utf-8-sig", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
-        w.writeheader()
-        for h in hits:
-            w.writerow(h)
+    with open(
+        out_path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20
+    ) as f:
+        w = csv.writer(f)
+        w.writerow(fields)
+        # project to lists in bounded batches (same values as DictWriter)
+        for i in range(0, len(hits), _CSV_BATCH_ROWS):
+            w.writerows(
+                [h.get(k, "") for k in fields]
+                for h in hits[i:i + _CSV_BATCH_ROWS]
+            )
 
 
 class AppController:
@@ -72,6 +119,7 @@ class AppController:
         self.out_dir = dirs["out"]
         self.backup_dir = dirs["backup"]
         self.audit_log_path = os.path.join(base_dir, "audit_log.jsonl")
+        self.audit = AuditLogWriter(self.audit_log_path)
 
     def process_file(self, file_path: str) -> ProcessResult:
         ext = os.path.splitext(file_path)[1].lower()
@@ -79,7 +127,7 @@ class AppController:
 
         self.log(f"backup: {base}")
         try:
-            shutil.copy2(file_path, os.path.join(self.backup_dir, base))
+            _fast_copy(file_path, os.path.join(self.backup_dir, base))
         except Exception:
             pass
 
@@ -123,8 +171,7 @@ class AppController:
         _export_hits_csv(report.get("hits", []), csv_path)
 
         # audit log
-        append_audit_log(
-            self.audit_log_path,
+        self.audit.append(
             {
                 "action": "process_file",
                 "doc_id": base,
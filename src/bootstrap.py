@@ -95,6 +95,8 @@ performance:
   fast_threshold_chars: 400000
   nlp_chunk_size: 15000
   nlp_chunk_overlap: 300
+  nlp_batch_size: 8
+  nlp_n_process: 1
 """
 
 PREFECTURES_TXT = """\
@@ -197,6 +199,20 @@ CUSTOM_KEYWORDS_TXT = """\
 # Bootstrap logic
 # ---------------------------------------------------------------------------
 
+# Encoded once; text-mode newline translation is applied here so the bytes
+# written below match what open(path, "w") used to produce.
+_TEMPLATE_BYTES: Dict[str, bytes] = {
+    name: content.replace("\n", os.linesep).encode("utf-8")
+    for name, content in (
+        ("masking_policy.yaml", POLICY_YAML),
+        ("prefectures.txt", PREFECTURES_TXT),
+        ("municipalities.txt", MUNICIPALITIES_TXT),
+        ("custom_companies.txt", CUSTOM_COMPANIES_TXT),
+        ("custom_keywords.txt", CUSTOM_KEYWORDS_TXT),
+    )
+}
+
+
 def ensure_bootstrap(base_dir: str) -> Dict[str, bool]:
     """Create missing directories and template files.
 
@@ -220,16 +236,17 @@ def ensure_bootstrap(base_dir: str) -> Dict[str, bool]:
 
     # Template files
     files = {
-        os.path.join(base_dir, "resources", "masking_policy.yaml"): POLICY_YAML,
-        os.path.join(base_dir, "resources", "dict", "prefectures.txt"): PREFECTURES_TXT,
-        os.path.join(base_dir, "resources", "dict", "municipalities.txt"): MUNICIPALITIES_TXT,
-        os.path.join(base_dir, "resources", "dict", "custom_companies.txt"): CUSTOM_COMPANIES_TXT,
-        os.path.join(base_dir, "resources", "dict", "custom_keywords.txt"): CUSTOM_KEYWORDS_TXT,
+        os.path.join(base_dir, "resources", "masking_policy.yaml"): _TEMPLATE_BYTES["masking_policy.yaml"],
+        os.path.join(base_dir, "resources", "dict", "prefectures.txt"): _TEMPLATE_BYTES["prefectures.txt"],
+        os.path.join(base_dir, "resources", "dict", "municipalities.txt"): _TEMPLATE_BYTES["municipalities.txt"],
+        os.path.join(base_dir, "resources", "dict", "custom_companies.txt"): _TEMPLATE_BYTES["custom_companies.txt"],
+        os.path.join(base_dir, "resources", "dict", "custom_keywords.txt"): _TEMPLATE_BYTES["custom_keywords.txt"],
     }
     for path, content in files.items():
         if not os.path.isfile(path):
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
+            # one full write: unbuffered binary handle
+            with open(path, "wb", buffering=0) as f:
                 f.write(content)
             results[path] = True
         else:
@@ -9,6 +9,35 @@ import os
 import sys
 import traceback
 
+
+def _walk_bounded(root, max_depth=None):
+    """os.walk (top-down, no symlink follow) that never descends below max_depth.
+
+    Yields (dirpath, depth, dirnames, filenames); depth 0 is root itself.
+    """
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        dirs, files = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry)
+        except OSError:
+            continue
+        yield path, depth, [d.name for d in dirs], [f.name for f in files]
+        if max_depth is not None and depth >= max_depth:
+            continue
+        # push reversed so subdirectories come out in listing order
+        for d in reversed(dirs):
+            if not d.is_symlink():
+                stack.append((d.path, depth + 1))
+
+
 print("=" * 60)
 print("  Legal Masking - Model Diagnostic")
 print("=" * 60)
@@ -35,11 +64,8 @@ found_models = []
 for base_label, base in [("_MEIPASS", meipass), ("EXE_DIR", exe_dir)]:
     if not os.path.isdir(base):
         continue
-    for root, dirs, files in os.walk(base):
-        # Skip very deep paths
-        depth = root[len(base):].count(os.sep)
-        if depth > 6:
-            continue
+    # Skip very deep paths (pruned before descending)
+    for root, depth, dirs, files in _walk_bounded(base, max_depth=6):
         if "meta.json" in files:
             has_cfg = "config.cfg" in files
             found_models.append(root)
@@ -59,8 +85,7 @@ if not found_models:
         print()
         print("--- spacy_models/ contents ---")
         sm = os.path.join(meipass, "spacy_models")
-        for root, dirs, files in os.walk(sm):
-            depth = root[len(sm):].count(os.sep)
+        for root, depth, dirs, files in _walk_bounded(sm):
             indent = "  " * (depth + 1)
             print(f"{indent}{os.path.basename(root)}/")
             for f in files[:10]:
@@ -7,6 +7,9 @@ WAREKI_RE = re.compile(
 YMD_RE = re.compile(
     r"(\d{4})[\/\.\-年]\s*(\d{1,2})[\/\.\-月]\s*(\d{1,2})\s*(日)?"
 )
+# ヒットごとに呼ばれるため bound method をモジュール定数に束縛
+_search_wareki = WAREKI_RE.search
+_search_ymd = YMD_RE.search
 
 
 def date_granular(original: str, mode: str = "YEAR") -> str:
@@ -14,12 +17,12 @@ def date_granular(original: str, mode: str = "YEAR") -> str:
     if mode == "FULL_MASK":
         return "[DATE]"
 
-    m = WAREKI_RE.search(s)
+    m = _search_wareki(s)
     if m:
         g, y = m.group(1), m.group(2)
         return f"{g}{y}年"
 
-    m2 = YMD_RE.search(s)
+    m2 = _search_ymd(s)
     if m2:
         y, mo = m2.group(1), m2.group(2)
         if mode == "YEAR":
@@ -1,42 +1,187 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import re
 
-from presidio_analyzer import PatternRecognizer, Pattern
+import regex
 
+from presidio_analyzer import (
+    AnalysisExplanation,
+    EntityRecognizer,
+    LocalRecognizer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerResult,
+)
 
-def _load_terms(path: str, limit: int = 50000) -> List[str]:
-    terms: List[str] = []
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                t = line.strip()
-                if not t or t.startswith("#"):
-                    continue
-                terms.append(t)
-                if len(terms) >= limit:
-                    break
-    except FileNotFoundError:
-        return []
-    return terms
+from .term_lists import load_sorted_terms
 
 
 def _escape_regex(s: str) -> str:
     return re.escape(s)
 
 
+_END = ""  # trie の終端キー（1 文字キーとは衝突しない）
+
+
+class _FoldTable(dict):
+    """str.translate 用の 1 文字 casefold 表（初出の文字だけ計算して覚える）
+
+    regex モジュールの IGNORECASE は 1 文字単位の simple case folding なので、
+    str.lower()（語末 Σ を ς にする等）ではなく 1 文字ずつ畳む
+    （Σ/σ/ς、K/k/K、ſ/s など）。例外はトルコ語の İ / ı で、regex では
+    İ=i, ı=I なのに İ≠I, ı≠i と推移的でないため、1 文字の代表に畳めない
+    （ここでは両者とも畳まずそのまま残す）。
+    """
+
+    def __missing__(self, cp: int) -> str:
+        c = chr(cp)
+        f = c.casefold()
+        if len(f) != 1:
+            f = c.lower()
+        if len(f) != 1:
+            f = c
+        self[cp] = f
+        return f
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+def _fold(s: str) -> str:
+    """PatternRecognizer の IGNORECASE 相当（長さを保つ）"""
+    return s.translate(_FOLD_TABLE)
+
+
+# PatternRecognizer（regex モジュール）の \\w そのもの。str.isalnum などで
+# 近似すると ① ² ½ などで境界判定が食い違う。
+_WORD_RE = regex.compile(r"\w")
+
+
+def _is_word(c: str) -> bool:
+    """regex モジュールの \\w か"""
+    return _WORD_RE.match(c) is not None
+
+
+class DictTrieRecognizer(LocalRecognizer):
+    """辞書語の trie を 1 パスで走査する recognizer
+
+    巨大な (t1|t2|...|tN) 正規表現の代わり。結果は make_dict_recognizer の
+    正規表現版と同じ（各位置で境界条件を満たす最長語を採用し、重ならない。
+    大文字小文字の例外は _FoldTable を参照）。
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        terms: Iterable[str],
+        score: float,
+        name: str,
+        use_boundaries: bool = True,
+    ):
+        self.score = score
+        self.use_boundaries = use_boundaries
+        self._trie: Dict[str, Any] = {}
+        for t in terms:
+            node = self._trie
+            for c in _fold(t):
+                node = node.setdefault(c, {})
+            node[_END] = True
+        # 先頭文字の候補位置まで search で読み飛ばす
+        firsts = "".join(re.escape(c) for c in self._trie if c != _END)
+        self._first_re = re.compile(f"[{firsts}]") if firsts else None
+        super().__init__(
+            supported_entities=[entity_type],
+            name=name,
+            supported_language="ja",
+        )
+
+    def load(self) -> None:
+        pass
+
+    def analyze(
+        self, text: str, entities: List[str], nlp_artifacts=None
+    ) -> List[RecognizerResult]:
+        results: List[RecognizerResult] = []
+        if self._first_re is None or not text:
+            return results
+        folded = _fold(text)
+        n = len(text)
+        trie = self._trie
+        bounds = self.use_boundaries
+        search = self._first_re.search
+        entity_type = self.supported_entities[0]
+
+        i = 0
+        while True:
+            m = search(folded, i)
+            if m is None:
+                break
+            i = m.start()
+            best = -1
+            if not (bounds and i > 0 and _is_word(text[i - 1])):
+                node = trie
+                j = i
+                while j < n:
+                    node = node.get(folded[j])
+                    if node is None:
+                        break
+                    j += 1
+                    if _END in node and not (
+                        bounds and j < n and _is_word(text[j])
+                    ):
+                        best = j
+            if best < 0:
+                i += 1
+                continue
+            results.append(
+                RecognizerResult(
+                    entity_type=entity_type,
+                    start=i,
+                    end=best,
+                    score=self.score,
+                    analysis_explanation=AnalysisExplanation(
+                        recognizer=self.name,
+                        original_score=self.score,
+                        pattern_name=f"dict_{entity_type}",
+                    ),
+                    recognition_metadata={
+                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                    },
+                )
+            )
+            i = best
+        # 走査が重ならないので remove_duplicates（O(n^2)）は不要
+        return results
+
+
 def make_dict_recognizer(
     entity_type: str,
     dict_path: str,
     score: float = 0.99,
     name: Optional[str] = None,
     use_boundaries: bool = True,
-) -> Optional[PatternRecognizer]:
-    terms = _load_terms(dict_path)
+    matcher: str = "trie",
+) -> Optional[EntityRecognizer]:
+    """辞書ファイルから recognizer を作る
+
+    matcher: "trie"（DictTrieRecognizer、既定） / "regex"（語の選択肢正規表現
+             による PatternRecognizer。結果は同じだが語数・ヒット数に比例して遅い）
+    """
+    # 長い順ソート済み（キャッシュ済み）
+    terms = load_sorted_terms(dict_path, 50000)
     if not terms:
         return None
 
-    terms.sort(key=len, reverse=True)
+    if matcher == "trie":
+        return DictTrieRecognizer(
+            entity_type=entity_type,
+            terms=terms,
+            score=score,
+            name=name or f"DICT_{entity_type}",
+            use_boundaries=use_boundaries,
+        )
+
     alts = "|".join(_escape_regex(t) for t in terms)
 
     if use_boundaries:
@@ -59,8 +204,8 @@ def make_dict_recognizer(
 
 def build_custom_dict_recognizers(
     dict_dir: str,
-) -> List[PatternRecognizer]:
-    recs: List[PatternRecognizer] = []
+) -> List[EntityRecognizer]:
+    recs: List[EntityRecognizer] = []
 
     r1 = make_dict_recognizer(
         entity_type="COMPANY",
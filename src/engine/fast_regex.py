@@ -1,8 +1,54 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple
+import os
 import re
+import sys
+
+try:
+    # Third-party `regex` (installed with presidio-analyzer) can release the
+    # GIL while scanning; the stdlib re cannot.
+    import regex as _regex
+except ImportError:  # pragma: no cover
+    _regex = None
+
+
+# (start, end, entity_type, score, pattern name)
+FastHit = Tuple[int, int, str, float, str]
+
+# Texts at least this long are scanned with one thread per pattern when
+# the `regex` module and more than one CPU are available.
+PARALLEL_MIN_CHARS = 200_000
+
+# \w \s \d \b (and negations) follow `regex`'s own Unicode tables, which
+# differ from re's (e.g. U+3099 and ²³ are \w only for re, U+001C-U+001F
+# are \s only for regex). Patterns using them always run on re.
+_UNICODE_CLASS_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[wWsSdDbB]")
+
+
+def _same_under_regex(pattern: str) -> bool:
+    """True if `regex` matches pattern exactly like re (no Unicode classes)."""
+    return _UNICODE_CLASS_RE.search(pattern) is None
+
+
+def _scan_pattern(
+    p: FastPattern, cre, text: str, allow: set, concurrent: bool = False
+) -> List[FastHit]:
+    gi = p.group_index
+    etype, score, name = p.entity_type, float(p.score), p.name
+    it = cre.finditer(text, concurrent=True) if concurrent else cre.finditer(text)
+    out: List[FastHit] = []
+    append = out.append
+    for m in it:
+        s, e = m.span(gi)
+        if s < 0 or e <= s:
+            continue
+        if allow and text[s:e] in allow:
+            continue
+        append((s, e, etype, score, name))
+    return out
 
 
 @dataclass(frozen=True)
@@ -11,53 +57,76 @@ class FastPattern:
     name: str
     regex: str
     score: float
+    # Characters of which at least one must occur in the text for the
+    # pattern to be able to match. Empty = always scan.
+    hint: str = ""
+    # Capture group whose span is reported (0 = whole match). Lets a
+    # pattern consume its left context instead of using a lookbehind.
+    group_index: int = 0
+
+    def __post_init__(self) -> None:
+        # Every hit references these strings; interning makes them shared
+        # with the engine's own literals and cheap to hash/compare.
+        object.__setattr__(self, "entity_type", sys.intern(self.entity_type))
+        object.__setattr__(self, "name", sys.intern(self.name))
 
 
 def default_patterns() -> List[FastPattern]:
-    # Keep in sync with engine/recognizers.py (but independent from Presidio)
+    # Keep in sync with engine/recognizers.py (but independent from Presidio).
+    # Fixed left contexts are matched literally and reported via group_index
+    # rather than written as lookbehinds, so re can prefix-scan the literal.
     return [
         FastPattern("EMAIL", "email_regex",
-            r"(?<![\w\-\.])([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?![\w\-\.])", 0.99),
+            r"(?<![\w\-\.])([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?![\w\-\.])", 0.99,
+            "@"),
         FastPattern("PHONE", "phone_regex",
-            r"(?<!\d)(0\d{1,4}[-\u30FC]?\d{1,4}[-\u30FC]?\d{3,4})(?!\d)", 0.85),
+            r"(?<!\d)(0\d{1,4}[-\u30FC]?\d{1,4}[-\u30FC]?\d{3,4})(?!\d)", 0.85,
+            "0"),
         FastPattern("ID", "jp_postal",
             r"(?<!\d)(\d{3}[-\u30FC]?\d{4})(?!\d)", 0.95),
         FastPattern("ID", "compact_id",
-            r"(?<![A-Za-z0-9])([A-Z]{1,3}\d{2,6})(?![A-Za-z0-9])", 0.80),
+            r"(?<![A-Za-z0-9])([A-Z]{1,3}\d{2,6})(?![A-Za-z0-9])", 0.80,
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
         FastPattern("ID", "hyphenated_id",
-            r"(?<![A-Za-z0-9])([A-Z]{2,10}-\d{2,4}(?:-[A-Z0-9]{1,6}){1,6})(?![A-Za-z0-9])", 0.85),
+            r"(?<![A-Za-z0-9])([A-Z]{2,10}-\d{2,4}(?:-[A-Z0-9]{1,6}){1,6})(?![A-Za-z0-9])", 0.85,
+            "-"),
         FastPattern("PERSON", "jp_name_line_with_space",
-            r"(?m)^[\t \u3000]*[一-龥]{1,4}[\t \u0020\u3000]+[一-龥]{1,4}[\t \u3000]*$", 0.86),
+            r"(?m)^[\t \u3000]*[一-龥]{1,4}[\t \u0020\u3000]+[一-龥]{1,4}[\t \u3000]*$", 0.86,
+            "\t \u3000"),
         FastPattern("PERSON", "tanto_single_surname",
-            r"(?<=担当[:：])[一-龥]{2,4}", 0.82),
-        FastPattern("PERSON", "tanto_single_surname_paren",
-            r"(?<=\(担当[:：])[一-龥]{2,4}(?=\))", 0.80),
-        FastPattern("PERSON", "tanto_single_surname_fwparen",
-            r"(?<=（担当[:：])[一-龥]{2,4}(?=）)", 0.80),
+            r"担当[:：]([一-龥]{2,4})", 0.82, "担", 1),
         FastPattern("ID", "age_after_colon",
-            r"(?<=年齢[:：])\d{1,3}", 0.75),
+            r"年齢[:：](\d{1,3})", 0.75, "齢", 1),
         FastPattern("ID", "age_standalone_line_before_gender",
-            r"(?m)(?<=\n)\d{1,3}(?=\n(?:男|女)\n)", 0.78),
+            r"\n(\d{1,3})(?=\n(?:男|女)\n)", 0.78, "男女", 1),
         FastPattern("MONEY", "money_amount",
             r"(?:"
             r"(?:[¥￥]\s*(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?)"
             r"|"
             r"(?:(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?\s*(?:円|万円|千円|百万円))"
-            r")", 0.85),
+            r")", 0.85,
+            "¥￥円"),
         FastPattern("DATE", "ymd",
-            r"\d{4}[\/\.\-\u5E74]\s*\d{1,2}[\/\.\-\u6708]\s*\d{1,2}\s*(\u65E5)?", 0.80),
+            r"\d{4}[\/\.\-\u5E74]\s*\d{1,2}[\/\.\-\u6708]\s*\d{1,2}\s*(\u65E5)?", 0.80,
+            "/.-\u5E74"),
         FastPattern("DATE", "wareki",
-            r"(\u4EE4\u548C|\u5E73\u6210|\u662D\u548C|R|H|S)\s*(\d{1,2}|\u5143)\s*\u5E74", 0.75),
+            r"(\u4EE4\u548C|\u5E73\u6210|\u662D\u548C|R|H|S)\s*(\d{1,2}|\u5143)\s*\u5E74", 0.75,
+            "\u5E74"),
         FastPattern("ADDRESS", "addr_hint",
-            r"(..??[\u90FD\u9053\u5E9C\u770C].{1,30}?[\u5E02\u533A\u753A\u6751].{0,40})", 0.55),
+            r"(..??[\u90FD\u9053\u5E9C\u770C].{1,30}?[\u5E02\u533A\u753A\u6751].{0,40})", 0.55,
+            "\u90FD\u9053\u5E9C\u770C"),
         FastPattern("COMPANY", "kabushiki_1",
-            r"(\u682A\u5F0F\u4F1A\u793E|\u6709\u9650\u4F1A\u793E|\u5408\u540C\u4F1A\u793E)\s*\S{1,30}", 0.70),
+            r"(\u682A\u5F0F\u4F1A\u793E|\u6709\u9650\u4F1A\u793E|\u5408\u540C\u4F1A\u793E)\s*\S{1,30}", 0.70,
+            "\u793E"),
         FastPattern("COMPANY", "kabushiki_2",
-            r"\S{1,30}\s*(\u682A\u5F0F\u4F1A\u793E|\u6709\u9650\u4F1A\u793E|\u5408\u540C\u4F1A\u793E)", 0.70),
+            r"\S{1,30}\s*(\u682A\u5F0F\u4F1A\u793E|\u6709\u9650\u4F1A\u793E|\u5408\u540C\u4F1A\u793E)", 0.70,
+            "\u793E"),
         FastPattern("COMPANY", "abbr",
-            r"(\uFF08\u682A\uFF09|\(\u682A\))\s*\S{1,30}", 0.65),
+            r"(\uFF08\u682A\uFF09|\(\u682A\))\s*\S{1,30}", 0.65,
+            "\u682A"),
         FastPattern("PARTIES", "parties",
-            r"(?<!\w)(\u7532|\u4E59|\u4E19|\u4E01)(?!\w)", 0.99),
+            r"(?<!\w)(\u7532|\u4E59|\u4E19|\u4E01)(?!\w)", 0.99,
+            "\u7532\u4E59\u4E19\u4E01"),
     ]
 
 
@@ -70,35 +139,104 @@ class FastRegexAnalyzer:
 
     def __init__(self, patterns: Optional[List[FastPattern]] = None):
         self._patterns = patterns or default_patterns()
-        self._compiled: List[Tuple[FastPattern, re.Pattern]] = []
+        # NOTE:
+        #   Patterns are compiled and scanned one by one on purpose. Merging
+        #   them into one (?P<name>...)|(?P<name>...) alternation per entity
+        #   type was measured slower with the stdlib re: a branch of groups
+        #   disables the literal/charset prefix skip each single pattern gets.
+        #   A Hyperscan multi-pattern database is not a drop-in either: the
+        #   email/phone/ID/parties patterns rely on lookarounds and the
+        #   tanto/age ones report a capture group, neither of which Hyperscan
+        #   supports. The rest (money_amount, ymd, wareki, addr_hint,
+        #   kabushiki_*, ...) would compile, but Hyperscan reports all
+        #   (overlapping) matches by end offset rather than finditer's
+        #   leftmost non-overlapping ones, so their hits would change too.
+        self._compiled: List[Tuple[FastPattern, re.Pattern, frozenset]] = []
         for p in self._patterns:
-            self._compiled.append((p, re.compile(p.regex)))
+            self._compiled.append((p, re.compile(p.regex), frozenset(p.hint)))
 
-    def analyze(
+        # Parallel path: patterns that mean the same under `regex` (see
+        # _same_under_regex) are compiled with it and scanned with
+        # concurrent=True in pool threads; the rest run on re in the calling
+        # thread meanwhile. Single threaded, `regex` is slower than re, so
+        # small texts stay serial.
+        safe = [_same_under_regex(p.regex) for p in self._patterns]
+        workers = min(os.cpu_count() or 1, sum(safe))
+        self._parallel: Optional[List] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        if _regex is not None and (os.cpu_count() or 1) > 1 and workers:
+            try:
+                self._parallel = [
+                    _regex.compile(p.regex) if ok else None
+                    for p, ok in zip(self._patterns, safe)
+                ]
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="fast-regex"
+                )
+            except Exception:
+                self._parallel = None
+        self.parallel_min_chars = PARALLEL_MIN_CHARS
+
+    def analyze_tuples(
         self,
         text: str,
         allow_list: Optional[List[str]] = None,
-    ) -> List[Dict[str, object]]:
+    ) -> List[FastHit]:
+        """Like analyze(), but returns (start, end, entity_type, score, pattern)
+        tuples so callers building their own records skip the dict step."""
         allow = set(allow_list or [])
-        out: List[Dict[str, object]] = []
-        for p, cre in self._compiled:
-            for m in cre.finditer(text):
-                s, e = m.start(), m.end()
-                if s < 0 or e <= s:
-                    continue
-                original = text[s:e]
-                if original in allow:
-                    continue
-                out.append(
-                    {
-                        "start": s,
-                        "end": e,
-                        "entity_type": p.entity_type,
-                        "score": float(p.score),
-                        "pattern": p.name,
-                        "source": "fast_regex",
-                    }
+        # One linear pass over the text decides which patterns can match at
+        # all; patterns whose hint characters never occur are not scanned.
+        present = set(text)
+        jobs = [
+            i for i, (_, _, hint) in enumerate(self._compiled)
+            if not (hint and hint.isdisjoint(present))
+        ]
+        out: List[FastHit] = []
+        if (
+            self._pool is not None
+            and len(text) >= self.parallel_min_chars
+            and len(jobs) > 1
+        ):
+            parallel = self._parallel
+            futures = {
+                i: self._pool.submit(
+                    _scan_pattern, self._compiled[i][0],
+                    parallel[i], text, allow, True,
                 )
-        # caller resolves overlaps
-        out.sort(key=lambda x: (int(x["start"]), -(int(x["end"]) - int(x["start"]))))
+                for i in jobs
+                if parallel[i] is not None
+            }
+            serial = {
+                i: _scan_pattern(self._compiled[i][0], self._compiled[i][1], text, allow)
+                for i in jobs
+                if parallel[i] is None
+            }
+            # pattern order, like the serial path (the sort below is stable)
+            for i in jobs:
+                out.extend(futures[i].result() if i in futures else serial[i])
+        else:
+            for i in jobs:
+                p, cre, _ = self._compiled[i]
+                out.extend(_scan_pattern(p, cre, text, allow))
+        # caller resolves overlaps; start asc, then longer first, packed into
+        # one int per hit (spans are far below 2**32) instead of a key tuple
+        out.sort(key=lambda x: (x[0] << 32) + x[0] - x[1])
         return out
+
+    def analyze(
+        self,
+        text: str,
+        allow_list: Optional[List[str]] = None,
+    ) -> List[Dict[str, object]]:
+        return [
+            {
+                "start": s,
+                "end": e,
+                "entity_type": etype,
+                "score": score,
+                "pattern": name,
+                "source": "fast_regex",
+            }
+            for s, e, etype, score, name in self.analyze_tuples(text, allow_list)
+        ]
@@ -1,18 +1,65 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from operator import itemgetter
 
 from presidio_analyzer import RecognizerResult
 
 from .presidio_factory import build_analyzer
 from .policy import load_policy
 from .stable_id import StableIdState
-from .text_rules import has_money_context, in_list
-from .address_rules import load_list, mask_address_granular
+from .text_rules import has_money_context, in_list, normalized_set
+from .address_rules import load_prefix_index, mask_address_granular
 from .date_rules import date_granular
 from .fast_regex import FastRegexAnalyzer
+from .party_extractor import extract_parties_full
 
 BLACK_CHAR = "\u25A0"  # ■
+# BLACK モードの置換文字列を長さごとに使い回す（長いスパンは都度生成）
+_BLACK_RUNS = tuple(BLACK_CHAR * n for n in range(128))
+
+_NEWLINE_RE = re.compile("\n")
+# 漢字・かな・数字が 1 文字も無い文書は GiNZA に渡しても得るものがない
+_JA_SIGNAL_RE = re.compile(r"[一-龯ぁ-んァ-ヶ0-9０-９]")
+# build_custom_dict_recognizers の recognizer 名（NLP 省略時も実行する）
+_DICT_RECOGNIZER_NAMES = frozenset({"CUSTOM_COMPANY_DICT", "CUSTOM_KEYWORD_DICT"})
+
+# 直近に解析したテキスト数（mask_text_with_report の解析結果キャッシュ）
+_CAND_CACHE_SIZE = 8
+
+# COMPANY スパン拡張（mask_text_with_report 内 _expand_company_span）
+_CORP_PREFIXES = ("株式会社", "有限会社", "合同会社", "合名会社", "合資会社")
+_CORP_ABBR = ("(株)", "（株）")
+_CORP_SUFFIXES = _CORP_PREFIXES
+_CORP_NAME_MAX = 80
+# 境界（ここで社名の連結を止める）
+_CORP_BOUNDARY_CHARS = (
+    " \t\r\n" +
+    "、。,.，．:：;；()（）[]［］{}｛｝<>＜＞《》【】「」『』\"'“”‘’・/\\|?!？!"
+)
+_CORP_NAME_CLASS = "[^" + "".join(
+    re.escape(c) for c in dict.fromkeys(_CORP_BOUNDARY_CHARS)
+) + "]"
+_CORP_WS_RE = re.compile(r"[ \t\r\n]*")
+_CORP_NAME_BODY_RE = re.compile(_CORP_NAME_CLASS + "{0,%d}" % _CORP_NAME_MAX)
+# search(text, ll - _CORP_NAME_MAX, ll): leftmost start of the run ending at ll
+_CORP_NAME_TAIL_RE = re.compile(_CORP_NAME_CLASS + r"*\Z")
+
+
+@dataclass(slots=True)
+class _Candidate:
+    """解析候補 1 件（mask_text_with_report 内部用。レポートの hits は別の dict）"""
+    start: int
+    end: int
+    entity_type: str
+    score: float
+    source: str = "analyzer"
+    pattern: Optional[str] = None
+    label: Optional[str] = None
+    forced_reason: Optional[str] = None
 
 
 @dataclass
@@ -23,6 +70,10 @@ class RuntimeOverrides:
     keep_spans: List[Dict[str, int]]
 
 
+def _black_run(n: int) -> str:
+    return _BLACK_RUNS[n] if 0 <= n < len(_BLACK_RUNS) else BLACK_CHAR * n
+
+
 def _count_by_entity(hits: List[Dict[str, Any]]) -> Dict[str, int]:
     out: Dict[str, int] = {}
     for h in hits:
@@ -34,19 +85,26 @@ def _count_by_entity(hits: List[Dict[str, Any]]) -> Dict[str, int]:
 def _normalize_forced_masks(
     forced_masks: Optional[List[Dict[str, Any]]],
 ) -> List[Dict[str, Any]]:
-    out = []
-    for fm in forced_masks or []:
+    out: List[Dict[str, Any]] = []
+    append = out.append
+    for fm in forced_masks or ():
         try:
-            s = int(fm["start"])
-            e = int(fm["end"])
+            s = fm["start"]
+            e = fm["end"]
+            # GUI から来る値はほぼ int。int() の呼び出しはそれ以外の時だけ
+            if type(s) is not int:
+                s = int(s)
+            if type(e) is not int:
+                e = int(e)
             if 0 <= s < e:
-                out.append(
+                get = fm.get
+                append(
                     {
                         "start": s,
                         "end": e,
-                        "entity_type": fm.get("entity_type", "CUSTOM"),
-                        "label": fm.get("label", None),
-                        "reason": fm.get("reason", "forced:mask_once"),
+                        "entity_type": get("entity_type", "CUSTOM"),
+                        "label": get("label", None),
+                        "reason": get("reason", "forced:mask_once"),
                     }
                 )
         except Exception:
@@ -54,6 +112,83 @@ def _normalize_forced_masks(
     return out
 
 
+_END_START = itemgetter(1, 0)
+
+
+def _max_weight_spans(
+    spans: List[Tuple[int, int, Tuple[float, ...], Any]],
+) -> List[Any]:
+    """重ならない部分集合のうち重み合計が最大のものを返す（start 順）
+
+    spans: (start, end, weight, item)。weight は同じ長さのタプルで、
+    合計は要素ごとの和、比較は辞書順。weighted interval scheduling の
+    DP（end 順に並べ、dp[i] = max(dp[i-1], dp[p(i)] + w_i)）。
+    同点なら先に終わるスパンを残す。
+    """
+    if not spans:
+        return []
+    spans = sorted(spans, key=_END_START)
+    ends = [sp[1] for sp in spans]
+    zero = tuple(0 for _ in spans[0][2])
+    # dp[i]: spans[:i] での最適値、take[i]: spans[i-1] を採用したか
+    dp = [zero]
+    take = [False]
+    prev_of = [0]
+    for i, (st, _en, w, _item) in enumerate(spans):
+        # p: spans[:i] のうち end <= st（半開区間で重ならない）の個数
+        p = bisect_right(ends, st, 0, i)
+        cand = tuple(a + b for a, b in zip(dp[p], w))
+        if cand > dp[i]:
+            dp.append(cand)
+            take.append(True)
+        else:
+            dp.append(dp[i])
+            take.append(False)
+        prev_of.append(p)
+
+    picked: List[Any] = []
+    i = len(spans)
+    while i > 0:
+        if take[i]:
+            picked.append(spans[i - 1][3])
+            i = prev_of[i]
+        else:
+            i -= 1
+    picked.reverse()
+    return picked
+
+
+def _resolution_spans(
+    candidates: List[Any], prio_get: Callable[..., Any]
+) -> List[Tuple[int, int, Tuple[float, ...], Any]]:
+    """_max_weight_spans 用の (start, end, weight, candidate) を作る
+
+    (forced, priority) の各レベルを重みタプルの別の桁にし、その桁には
+    span 長を入れる（最後の桁は score）。辞書順比較なので、上位レベルで
+    覆う文字数が多い組み合わせが、下位レベルを何件集めたものより優先される
+    （例: ADDRESS 1 件が、それに重なる DATE + MONEY の 2 件に負けない）。
+    同じレベル内では件数ではなく覆う文字数で比べるため、長いスパン 1 件が
+    その内側の短いスパン 2 件に負けることもない
+    （例: ID "ABC-1234-AB12-CD34" が内側の "AB12" + "CD34" に負けない）。
+    """
+    levels = [
+        (1 if c.source == "forced" else 0,
+         int(prio_get(c.entity_type or "", 0) or 0))
+        for c in candidates
+    ]
+    order = sorted(set(levels), reverse=True)
+    n = len(order)
+    slot = {lv: i for i, lv in enumerate(order)}
+    spans = []
+    for c, lv in zip(candidates, levels):
+        weight = [0] * n
+        weight[slot[lv]] = int(c.end - c.start)
+        spans.append(
+            (c.start, c.end, tuple(weight) + (float(c.score or 0.0),), c)
+        )
+    return spans
+
+
 class MaskingEngine:
     def __init__(self, policy_path: str, base_dir: str, log_fn=None):
         self.policy_path = policy_path
@@ -99,14 +234,24 @@ class MaskingEngine:
         # Only fall back to regex-only for extremely large files (5x previous limit)
         self.fast_threshold_chars = int(perf.get('fast_threshold_chars', 400000) or 400000)
         self.force_fast = bool(perf.get('force_fast', False))
+        # Chunks handed to spaCy's nlp.pipe per batch in chunked mode
+        self.nlp_batch_size = max(1, int(perf.get('nlp_batch_size', 8) or 8))
+        # Worker processes for nlp.pipe in chunked mode (1 = in-process).
+        # Each worker loads its own copy of the GiNZA model.
+        self.nlp_n_process = max(1, int(perf.get('nlp_n_process', 1) or 1))
 
         self.runtime = RuntimeOverrides(
             once_allowlist=[], forced_masks=[], keep_spans=[]
         )
+        self._rebuild_keep_index()
+        # (text, allowlist, mode) -> analyzer candidates; see _analyzer_candidates
+        self._cand_cache: "OrderedDict[tuple, List[_Candidate]]" = OrderedDict()
 
         # 住所辞書
-        self.prefectures = load_list(f"{dict_dir}/prefectures.txt")
-        self.municipalities = load_list(f"{dict_dir}/municipalities.txt")
+        self.prefectures = load_prefix_index(f"{dict_dir}/prefectures.txt")
+        self.municipalities = load_prefix_index(
+            f"{dict_dir}/municipalities.txt"
+        )
 
     def set_runtime_overrides(
         self,
@@ -128,44 +273,57 @@ class MaskingEngine:
                 and 0 <= int(x.get("start", -1)) < int(x.get("end", -1))
             ],
         )
-
-    @staticmethod
-    def _overlaps_any_keep(start: int, end: int, keep_spans: List[Dict[str, int]]) -> bool:
-        for ks in keep_spans or []:
-            try:
-                s = int(ks.get("start"))
-                e = int(ks.get("end"))
-                if start < e and end > s:
-                    return True
-            except Exception:
-                continue
-        return False
+        self._rebuild_keep_index()
+
+    def _rebuild_keep_index(self) -> None:
+        """Merge keep_spans into sorted, disjoint [start, end) runs."""
+        starts: List[int] = []
+        ends: List[int] = []
+        for ks in sorted(
+            self.runtime.keep_spans or [], key=lambda k: k["start"]
+        ):
+            s, e = ks["start"], ks["end"]
+            if ends and s <= ends[-1]:
+                if e > ends[-1]:
+                    ends[-1] = e
+            else:
+                starts.append(s)
+                ends.append(e)
+        self._keep_starts = starts
+        self._keep_ends = ends
 
     def _merge_overlaps(
         self, results: List[RecognizerResult]
     ) -> List[RecognizerResult]:
-        rs = sorted(
-            results, key=lambda r: (r.start, -(r.end - r.start))
+        # Flatten to (start, end, priority, score, result) once so the merge
+        # loop below works on tuple fields only.
+        prio_get = self.entity_priority.get
+        recs = sorted(
+            (
+                (
+                    r.start,
+                    r.end,
+                    int(prio_get(getattr(r, "entity_type", "") or "", 0)),
+                    float(getattr(r, "score", 0.0) or 0.0),
+                    r,
+                )
+                for r in results
+            ),
+            key=lambda x: (x[0], x[0] - x[1]),
         )
         merged = []
-        for r in rs:
+        for rec in recs:
             if not merged:
-                merged.append(r)
+                merged.append(rec)
                 continue
             prev = merged[-1]
-            if r.start < prev.end:
+            if rec[0] < prev[1]:
                 # overlap: prefer higher priority, then longer span, then higher score
-                p_new = int(self.entity_priority.get(getattr(r, "entity_type", "") or "", 0))
-                p_prev = int(self.entity_priority.get(getattr(prev, "entity_type", "") or "", 0))
-                len_new = (r.end - r.start)
-                len_prev = (prev.end - prev.start)
-                s_new = float(getattr(r, "score", 0.0) or 0.0)
-                s_prev = float(getattr(prev, "score", 0.0) or 0.0)
-                if (p_new, len_new, s_new) > (p_prev, len_prev, s_prev):
-                    merged[-1] = r
+                if (rec[2], rec[1] - rec[0], rec[3]) > (prev[2], prev[1] - prev[0], prev[3]):
+                    merged[-1] = rec
             else:
-                merged.append(r)
-        return merged
+                merged.append(rec)
+        return [rec[4] for rec in merged]
 
     # ------------------------------------------------------------------
     # Chunked NLP analysis for large documents
@@ -189,15 +347,18 @@ class MaskingEngine:
         chunks: List[Tuple[int, str]] = []
         pos = 0
         text_len = len(text)
+        # newline offsets, found once; each boundary is then a bisect
+        newlines = [m.start() for m in _NEWLINE_RE.finditer(text)]
 
         while pos < text_len:
             end = min(pos + chunk_size, text_len)
 
             # Try to break at a paragraph boundary
             if end < text_len:
-                # Search backward from end for a newline
-                break_at = text.rfind("\n", pos + chunk_size // 2, end)
-                if break_at > pos:
+                # last newline in [pos + chunk_size // 2, end)
+                j = bisect_left(newlines, end) - 1
+                break_at = newlines[j] if j >= 0 else -1
+                if break_at >= pos + chunk_size // 2 and break_at > pos:
                     end = break_at + 1  # include the newline
 
             chunks.append((pos, text[pos:end]))
@@ -210,11 +371,44 @@ class MaskingEngine:
 
         return chunks
 
+    def _iter_nlp_artifacts(self, texts: List[str]):
+        """Yield NlpArtifacts for each text from one batched nlp.pipe pass.
+
+        Yields None for texts that could not be processed in the batch
+        (analyze() then runs the NLP engine for that text itself).
+        """
+        done = 0
+        batch_size = min(self.nlp_batch_size, len(texts))
+        try:
+            nlp_engine = self.analyzer.nlp_engine
+            if self.nlp_n_process > 1 and len(texts) >= 4:
+                # process_batch() has no n_process; drive spaCy directly and
+                # convert with the engine's own Doc -> NlpArtifacts helper.
+                docs = nlp_engine.nlp["ja"].pipe(
+                    texts, batch_size=batch_size,
+                    n_process=min(self.nlp_n_process, len(texts)),
+                )
+                batches = (
+                    (doc.text, nlp_engine._doc_to_nlp_artifact(doc, "ja"))
+                    for doc in docs
+                )
+            else:
+                batches = nlp_engine.process_batch(
+                    texts, language="ja", batch_size=batch_size,
+                )
+            for _, artifacts in batches:
+                done += 1
+                yield artifacts
+        except Exception as e:
+            self._log(f"  batched NLP stopped after {done} chunks ({e}); continuing per chunk")
+        for _ in range(done, len(texts)):
+            yield None
+
     def _analyze_chunked(
         self,
         text: str,
         allowlist: List[str],
-    ) -> List[Dict[str, Any]]:
+    ) -> List[_Candidate]:
         """Analyze large text by splitting into chunks and processing
         each chunk with full Presidio+GiNZA NLP.
 
@@ -226,59 +420,60 @@ class MaskingEngine:
             text, self.nlp_chunk_size, self.nlp_chunk_overlap,
         )
 
-        all_results: List[Dict[str, Any]] = []
+        all_results: List[_Candidate] = []
         total_chunks = len(chunks)
         self._log(f"chunked NLP: {total_chunks} chunks ({len(text):,} chars)")
 
+        # spaCy/GiNZA runs once over all chunks (nlp.pipe); each chunk's
+        # analyze() then reuses its NlpArtifacts instead of re-parsing.
+        chunk_artifacts = self._iter_nlp_artifacts([ct for _, ct in chunks])
+
         for ci, (chunk_offset, chunk_text) in enumerate(chunks, 1):
             self._log(f"  chunk {ci}/{total_chunks} (offset={chunk_offset:,}, len={len(chunk_text):,})")
             try:
+                artifacts = next(chunk_artifacts, None)
                 results = self.analyzer.analyze(
                     text=chunk_text, language="ja", allow_list=allowlist,
+                    nlp_artifacts=artifacts,
                 )
                 merged = self._merge_overlaps(results)
                 for r in merged:
-                    all_results.append({
-                        "start": r.start + chunk_offset,
-                        "end": r.end + chunk_offset,
-                        "entity_type": r.entity_type,
-                        "score": float(getattr(r, "score", 0.0) or 0.0),
-                        "source": "analyzer",
-                    })
+                    all_results.append(_Candidate(
+                        r.start + chunk_offset,
+                        r.end + chunk_offset,
+                        r.entity_type,
+                        float(getattr(r, "score", 0.0) or 0.0),
+                    ))
             except Exception:
                 # If a chunk fails (e.g., memory), fall back to regex for that chunk
                 try:
-                    fast_results = self.fast_analyzer.analyze(
+                    fast_results = self.fast_analyzer.analyze_tuples(
                         text=chunk_text, allow_list=allowlist,
                     )
-                    for r in (fast_results or []):
-                        all_results.append({
-                            "start": int(r["start"]) + chunk_offset,
-                            "end": int(r["end"]) + chunk_offset,
-                            "entity_type": str(r["entity_type"]),
-                            "score": float(r.get("score", 0.0) or 0.0),
-                            "source": "analyzer",
-                            "pattern": r.get("pattern"),
-                        })
+                    for fs, fe, fet, fsc, fpat in fast_results:
+                        all_results.append(_Candidate(
+                            fs + chunk_offset, fe + chunk_offset, fet, fsc,
+                            pattern=fpat,
+                        ))
                 except Exception:
                     continue
 
         # Deduplicate: sort by start, then resolve overlaps
-        all_results.sort(key=lambda x: (x["start"], -(x["end"] - x["start"])))
-        deduped: List[Dict[str, Any]] = []
+        all_results.sort(key=lambda x: (x.start, x.start - x.end))
+        deduped: List[_Candidate] = []
         for r in all_results:
             if not deduped:
                 deduped.append(r)
                 continue
             prev = deduped[-1]
-            if r["start"] < prev["end"]:
+            if r.start < prev.end:
                 # Overlap from chunk boundary: keep the one with higher score/priority
-                p_new = int(self.entity_priority.get(r.get("entity_type", ""), 0))
-                p_prev = int(self.entity_priority.get(prev.get("entity_type", ""), 0))
-                len_new = r["end"] - r["start"]
-                len_prev = prev["end"] - prev["start"]
-                s_new = float(r.get("score", 0.0))
-                s_prev = float(prev.get("score", 0.0))
+                p_new = int(self.entity_priority.get(r.entity_type, 0))
+                p_prev = int(self.entity_priority.get(prev.entity_type, 0))
+                len_new = r.end - r.start
+                len_prev = prev.end - prev.start
+                s_new = float(r.score)
+                s_prev = float(prev.score)
                 if (p_new, len_new, s_new) > (p_prev, len_prev, s_prev):
                     deduped[-1] = r
             else:
@@ -286,6 +481,89 @@ class MaskingEngine:
 
         return deduped
 
+    def _dict_candidates(
+        self, text: str, allowlist: List[str]
+    ) -> List[_Candidate]:
+        """Hits of the registry's custom dictionary recognizers, without NLP.
+
+        custom_companies.txt (written by ALWAYS_MASK_AS_COMPANY) and
+        custom_keywords.txt are user-registered terms, so they must be
+        masked even when the NLP pass is skipped.
+        """
+        if self.analyzer is None:
+            return []
+        allow = set(allowlist)
+        out: List[_Candidate] = []
+        for rec in self.analyzer.registry.recognizers:
+            if rec.name not in _DICT_RECOGNIZER_NAMES:
+                continue
+            for r in rec.analyze(text, rec.supported_entities, None):
+                if text[r.start:r.end] in allow:
+                    continue
+                out.append(
+                    _Candidate(r.start, r.end, r.entity_type, float(r.score))
+                )
+        return out
+
+    def _analyzer_candidates(
+        self,
+        text: str,
+        allowlist: List[str],
+        use_fast: bool,
+        use_chunked: bool,
+        with_dicts: bool = False,
+    ) -> List[_Candidate]:
+        """Analyzer candidates for text, cached on (text, allowlist, mode).
+
+        with_dicts adds the custom dictionary recognizers to the regex-only
+        pass (they need no NLP; see _dict_candidates).
+
+        GUI toggles re-mask the same text with different forced_masks /
+        keep_spans, which are applied after this step, so the NLP pass
+        is reused. Candidates are never mutated, so only the list is
+        copied (callers append forced masks to it).
+        """
+        key = (text, tuple(allowlist), use_fast, use_chunked, with_dicts)
+        cached = self._cand_cache.get(key)
+        if cached is not None:
+            self._cand_cache.move_to_end(key)
+            self._log("analysis: reusing cached analyzer results")
+            return list(cached)
+
+        candidates: List[_Candidate] = []
+
+        if use_fast:
+            merged_fast = self.fast_analyzer.analyze_tuples(
+                text=text, allow_list=allowlist
+            )
+            candidates = [
+                _Candidate(fs, fe, fet, fsc, pattern=fpat)
+                for fs, fe, fet, fsc, fpat in merged_fast
+            ]
+            if with_dicts:
+                candidates.extend(self._dict_candidates(text, allowlist))
+        elif use_chunked:
+            # Chunked NLP: split into overlapping chunks, analyze each
+            # with full Presidio+GiNZA, then merge with deduplication
+            candidates = self._analyze_chunked(text, allowlist)
+        else:
+            results = self.analyzer.analyze(text=text, language="ja", allow_list=allowlist)
+            merged = self._merge_overlaps(results)
+            for r in merged:
+                candidates.append(
+                    _Candidate(
+                        r.start,
+                        r.end,
+                        r.entity_type,
+                        float(getattr(r, "score", 0.0) or 0.0),
+                    )
+                )
+
+        self._cand_cache[key] = list(candidates)
+        while len(self._cand_cache) > _CAND_CACHE_SIZE:
+            self._cand_cache.popitem(last=False)
+        return candidates
+
     def mask_text_with_report(
         self,
         text: str,
@@ -301,7 +579,6 @@ class MaskingEngine:
         )
 
         # party auto-detection (expanded: roles + structural terms)
-        from .party_extractor import extract_parties_full
         party_result = extract_parties_full(text)
         self_names = party_result.self_names
         party_labels = party_result.allowlist_labels  # 甲乙 + 委託者 + 本契約 etc.
@@ -314,13 +591,20 @@ class MaskingEngine:
                 + (self.runtime.once_allowlist or [])
             )
         )
+        # normalized once; in_list on the set is an O(1) lookup per hit
+        allow_set = normalized_set(allowlist)
 
-        
         # analyzer: 3-tier strategy based on text length
         #   - small  (< nlp_chunk_size):     full NLP in one pass
         #   - medium (< fast_threshold):     chunked NLP (split + merge)
         #   - huge   (>= fast_threshold):    regex-only fallback
+        #   - no kanji/kana/digits at all:   regex-only (NLP has nothing to find)
         use_fast = self.force_fast or (not self.nlp_available) or (len(text) >= self.fast_threshold_chars)
+        no_ja_signal = (
+            not use_fast and _JA_SIGNAL_RE.search(text) is None
+        )
+        if no_ja_signal:
+            use_fast = True
         use_chunked = (
             not use_fast
             and len(text) >= self.nlp_chunk_size
@@ -329,6 +613,8 @@ class MaskingEngine:
         if use_fast:
             if not self.nlp_available:
                 self._log("analysis: regex-only mode (NLP engine not available)")
+            elif no_ja_signal:
+                self._log("analysis: regex-only mode (no Japanese text or digits)")
             else:
                 self._log(f"analysis: regex-only mode ({len(text):,} chars >= {self.fast_threshold_chars:,} threshold)")
         elif use_chunked:
@@ -336,98 +622,46 @@ class MaskingEngine:
         else:
             self._log(f"analysis: full NLP mode ({len(text):,} chars)")
 
-        candidates: List[Dict[str, Any]] = []
-
-        if use_fast:
-            merged_fast = self.fast_analyzer.analyze(text=text, allow_list=allowlist)
-            for r in (merged_fast or []):
-                candidates.append(
-                    {
-                        "start": int(r["start"]),
-                        "end": int(r["end"]),
-                        "entity_type": str(r["entity_type"]),
-                        "score": float(r.get("score", 0.0) or 0.0),
-                        "source": "analyzer",
-                        "pattern": r.get("pattern"),
-                    }
-                )
-        elif use_chunked:
-            # Chunked NLP: split into overlapping chunks, analyze each
-            # with full Presidio+GiNZA, then merge with deduplication
-            candidates = self._analyze_chunked(text, allowlist)
-        else:
-            results = self.analyzer.analyze(text=text, language="ja", allow_list=allowlist)
-            merged = self._merge_overlaps(results)
-            for r in merged:
-                candidates.append(
-                    {
-                        "start": r.start,
-                        "end": r.end,
-                        "entity_type": r.entity_type,
-                        "score": float(getattr(r, "score", 0.0) or 0.0),
-                        "source": "analyzer",
-                    }
-                )
+        candidates = self._analyzer_candidates(
+            text, allowlist, use_fast, use_chunked, with_dicts=no_ja_signal
+        )
 
         forced = _normalize_forced_masks(self.runtime.forced_masks)
         for fm in forced:
             candidates.append(
-                {
-                    "start": fm["start"],
-                    "end": fm["end"],
-                    "entity_type": fm["entity_type"],
-                    "score": 1.0,
-                    "source": "forced",
-                    "label": fm.get("label"),
-                    "forced_reason": fm.get("reason"),
-                }
+                _Candidate(
+                    fm["start"],
+                    fm["end"],
+                    fm["entity_type"],
+                    1.0,
+                    source="forced",
+                    label=fm.get("label"),
+                    forced_reason=fm.get("reason"),
+                )
             )
 
         # resolve overlaps:
         #   forced > (priority) > (span length) > (score)
+        # 重なり合う候補から「重みの合計が最大」になる重ならない組を選ぶ
+        # (weighted interval scheduling)。重みは _resolution_spans を参照
+        # （上位の forced/priority は下位の件数では覆らない）。
         # NOTE:
         #   旧実装は「長いスパン優先」で先に確定してしまい、
         #   低精度の MONEY が他エンティティを潰すことがあった。
-        def _cand_key(x: Dict[str, Any]) -> Tuple[int, int, int, float]:
-            src_rank = 0 if x.get("source") == "forced" else 1
-            pr = int(self.entity_priority.get(x.get("entity_type") or "", 0) or 0)
-            ln = int((x.get("end") or 0) - (x.get("start") or 0))
-            sc = float(x.get("score", 0.0) or 0.0)
-            # sort asc by start separately
-            return (src_rank, -pr, -ln, -sc)
-
-        candidates = sorted(candidates, key=lambda x: (x["start"],) + _cand_key(x))
-        resolved: List[Dict[str, Any]] = []
-        for c in candidates:
-            if not resolved:
-                resolved.append(c)
-                continue
-            prev = resolved[-1]
-            if c["start"] < prev["end"]:
-                # overlap: keep the "better" one
-                if _cand_key(c) < _cand_key(prev):
-                    # _cand_key() is ordered so that "better" is smaller
-                    resolved[-1] = c
-            else:
-                resolved.append(c)
-
-        # span-level keep overrides: if a span overlaps a keep_span, do not mask it.
-        # (Used by GUI toggles to disable masking for a specific detection.)
-        keep_spans = self.runtime.keep_spans or []
-        if keep_spans:
-            def _overlaps(a_s: int, a_e: int, b_s: int, b_e: int) -> bool:
-                return a_s < b_e and a_e > b_s
-
-            resolved = [
-                r
-                for r in resolved
-                if not any(_overlaps(r["start"], r["end"], ks["start"], ks["end"]) for ks in keep_spans)
-            ]
+        #   貪欲法（隣同士で良い方を残す）も、A と C を両方残せるのに
+        #   間にまたがる B が両方を落とす連鎖があったため DP にした。
+        resolved: List[_Candidate] = _max_weight_spans(
+            _resolution_spans(candidates, self.entity_priority.get)
+        )
 
+        # Output pieces. Text is only sliced where a replacement actually
+        # differs: kept hits (parties, allowlist, ...) stay inside the
+        # pending run text[flushed:last] instead of costing two slices each.
         out = []
         hits = []
         review = []
         last = 0
+        flushed = 0
 
         output_conf = self.policy.get("output", {}) or {}
         mode = output_conf.get("mode", "LABEL")
@@ -440,76 +674,68 @@ class MaskingEngine:
             self.policy.get("review", {}).get("threshold", 0.8)
         )
 
-        for r in resolved:
-            start, end = r["start"], r["end"]
-            entity = r["entity_type"]
-            score = float(r.get("score", 0.0) or 0.0)
-
-            # --- Heuristic span expansion (契約書の会社名でよくある崩れ対策) ---
-            # Analyzer が「株式会社」などの法人格部分だけを COMPANY として
-            # 抜いてしまう場合があり、そのままだと「[COMPANY]明和エンジニアリング」
-            # のように社名本体が残ってしまう。
-            # そこで、法人格のみ/末尾のみの検出は、隣接する社名本体までスパンを拡張する。
-            corp_prefixes = ("株式会社", "有限会社", "合同会社", "合名会社", "合資会社")
-            corp_abbr = ("(株)", "（株）")
-            corp_suffixes = corp_prefixes
-            # 境界（ここで社名の連結を止める）
-            boundaries = set(
-                " \t\r\n" +
-                "、。,.，．:：;；()（）[]［］{}｛｝<>＜＞《》【】「」『』\"'“”‘’・/\\|?!？!"
-            )
+        # --- Heuristic span expansion (契約書の会社名でよくある崩れ対策) ---
+        # Analyzer が「株式会社」などの法人格部分だけを COMPANY として
+        # 抜いてしまう場合があり、そのままだと「[COMPANY]明和エンジニアリング」
+        # のように社名本体が残ってしまう。
+        # そこで、法人格のみ/末尾のみの検出は、隣接する社名本体までスパンを拡張する。
+        def _expand_company_span(s: int, e: int) -> Tuple[int, int]:
+            """Expand COMPANY span to cover adjacent company name tokens."""
+            if s < 0 or e <= s or e > len(text):
+                return s, e
+            seg = text[s:e]
+
+            # 1) prefix-only (e.g., "株式会社") -> expand right
+            if seg in _CORP_PREFIXES or seg in _CORP_ABBR:
+                # skip whitespace, then consume name body until boundary
+                rr = _CORP_WS_RE.match(text, e).end()
+                return s, _CORP_NAME_BODY_RE.match(text, rr).end()
+
+            # 2) suffix-only (rare, e.g., "〇〇株式会社" broken and only suffix detected)
+            if seg in _CORP_SUFFIXES:
+                ll = s
+                while ll > 0 and text[ll - 1] in (" ", "\t", "\r", "\n"):
+                    ll -= 1
+                # name body directly before ll (at most _CORP_NAME_MAX chars)
+                m = _CORP_NAME_TAIL_RE.search(
+                    text, max(0, ll - _CORP_NAME_MAX), ll
+                )
+                return m.start(), e
 
-            def _expand_company_span(s: int, e: int) -> Tuple[int, int]:
-                """Expand COMPANY span to cover adjacent company name tokens."""
-                if s < 0 or e <= s or e > len(text):
-                    return s, e
-                seg = text[s:e]
-
-                # 1) prefix-only (e.g., "株式会社") -> expand right
-                if seg in corp_prefixes or seg in corp_abbr:
-                    rr = e
-                    # skip whitespace
-                    while rr < len(text) and text[rr] in (" ", "\t", "\r", "\n"):
-                        rr += 1
-                    # consume name body until boundary
-                    max_len = 80
-                    consumed = 0
-                    while rr < len(text) and text[rr] not in boundaries and consumed < max_len:
-                        rr += 1
-                        consumed += 1
-                    return s, rr
-
-                # 2) suffix-only (rare, e.g., "〇〇株式会社" broken and only suffix detected)
-                if seg in corp_suffixes:
-                    ll = s
-                    while ll > 0 and text[ll - 1] in (" ", "\t", "\r", "\n"):
-                        ll -= 1
-                    max_len = 80
-                    consumed = 0
-                    while ll > 0 and text[ll - 1] not in boundaries and consumed < max_len:
-                        ll -= 1
-                        consumed += 1
-                    return ll, e
+            return s, e
 
-                return s, e
+        # span-level keep overrides: if a span overlaps a keep_span, do not mask it.
+        # (Used by GUI toggles to disable masking for a specific detection.)
+        # resolved is start-ordered and disjoint, so one cursor walks the
+        # merged keep runs alongside it instead of a separate filter pass.
+        keep_starts = self._keep_starts
+        keep_ends = self._keep_ends
+        n_keep = len(keep_starts)
+        k = 0
+
+        for r in resolved:
+            start, end = r.start, r.end
+            if n_keep:
+                # first merged run ending after `start` is the only candidate
+                while k < n_keep and keep_ends[k] <= start:
+                    k += 1
+                if k < n_keep and keep_starts[k] < end:
+                    continue
+            entity = r.entity_type
+            score = float(r.score or 0.0)
 
             # apply expansion before slicing original
-            if entity == "COMPANY" and r.get("source") != "forced":
+            if entity == "COMPANY" and r.source != "forced":
                 start, end = _expand_company_span(start, end)
-                r["start"], r["end"] = start, end
 
             original = text[start:end]
 
-            out.append(text[last:start])
-
             # decide replacement
-            if r["source"] == "forced":
+            if r.source == "forced":
                 if mode == "BLACK":
-                    repl = BLACK_CHAR * max(
-                        black_min_len, len(original)
-                    )
+                    repl = _black_run(max(black_min_len, len(original)))
                 else:
-                    label = r.get("label")
+                    label = r.label
                     repl = (
                         label
                         if label
@@ -517,14 +743,12 @@ class MaskingEngine:
                             entity, original, label_format
                         )
                     )
-                reason = r.get(
-                    "forced_reason", "forced:mask_once"
-                )
+                reason = r.forced_reason
             else:
                 if entity == "PARTIES":
                     repl = original
                     reason = "keep:parties"
-                elif in_list(original, allowlist):
+                elif in_list(original, allow_set):
                     repl = original
                     reason = "keep:allowlist"
                 elif entity == "MONEY" and not has_money_context(
@@ -534,9 +758,7 @@ class MaskingEngine:
                     reason = "keep:money_no_context"
                 else:
                     if mode == "BLACK":
-                        repl = BLACK_CHAR * max(
-                            black_min_len, len(original)
-                        )
+                        repl = _black_run(max(black_min_len, len(original)))
                         reason = "mask:black"
                     else:
                         if entity == "DATE":
@@ -558,7 +780,12 @@ class MaskingEngine:
                             )
                             reason = "mask:stable_id"
 
-            out.append(repl)
+            if repl != original or start < last:
+                # (start < last: previous span was expanded over this one;
+                # emit exactly as the piecewise text[last:start] + repl)
+                out.append(text[flushed:max(start, last)])
+                out.append(repl)
+                flushed = end
             last = end
 
             hit = {
@@ -570,20 +797,20 @@ class MaskingEngine:
                 "original": original,
                 "replacement": repl,
                 "reason": reason,
-                "source": r.get("source", "analyzer"),
+                "source": r.source,
             }
             hits.append(hit)
 
             if (
                 (score and score < review_th)
                 or reason in ("keep:money_no_context",)
-                or r["source"] == "forced"
+                or r.source == "forced"
             ):
                 h2 = dict(hit)
                 h2["review_flag"] = True
                 review.append(h2)
 
-        out.append(text[last:])
+        out.append(text[flushed:])
         masked = "".join(out)
 
         report = {
@@ -1,19 +1,29 @@
 from __future__ import annotations
-import re
 import unicodedata
-
-_WS_RE = re.compile(r"\s+")
+from functools import lru_cache
 
 
 def nfkc(s: str) -> str:
-    return unicodedata.normalize("NFKC", s or "")
+    if not s:
+        return ""
+    # ASCII は NFKC で変化しない（isascii は文字列のフラグを見るだけで O(1)）
+    if s.isascii():
+        return s
+    # 既に NFKC なら（機械生成テキストの大半）コピーせずそのまま返す
+    if unicodedata.is_normalized("NFKC", s):
+        return s
+    return unicodedata.normalize("NFKC", s)
 
 
+@lru_cache(maxsize=8192)
 def normalize_term(s: str) -> str:
-    """allowlist照合・stable id等で統一利用"""
-    s = nfkc(s)
-    s = _WS_RE.sub(" ", s).strip()
-    return s
+    """allowlist照合・stable id等で統一利用
+
+    純粋関数なので結果をキャッシュする（同じ語が文書内・文書間で繰り返し現れる）。
+    """
+    # 空白の連続を 1 つの半角スペースにまとめ、前後の空白を除く
+    # （str.split() の空白判定は正規表現の \s と同じ）
+    return " ".join(nfkc(s).split())
 
 
 def normalize_text_for_analysis(text: str) -> str:
@@ -17,6 +17,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+from .normalize import normalize_term
+
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -55,16 +57,20 @@ TRADITIONAL_LABELS = {"甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "
 # Pattern 1: XX株式会社（以下「甲」という）
 #   The entity name typically starts after a separator (「と」「・」start of line, etc.)
 #   and ends just before the parenthetical definition.
+#   Labels (here and in patterns 2/3) never span lines; excluding \r\n stops
+#   an unclosed quote from being retried across the following lines.
 PARTY_DEF_PAT = re.compile(
     r"(?:^|[。、，,\n・と])\s*"    # entity start boundary
-    r"(?P<entity>"
-    r"(?:[^\s（(「『。、，,]{2,60}?)"  # entity name (avoid consuming parens/quotes)
-    r")"
+    # entity name (avoid consuming parens/quotes). The class excludes the
+    # \s and parens that must follow, so only the whole run can succeed;
+    # lookahead + backreference makes it atomic (re on 3.10 has no (?>...))
+    # so a failed line is not retried at every shorter length.
+    r"(?=(?P<entity>[^\s（(「『。、，,]{2,60}))(?P=entity)"
     r"\s*"
     r"(?:（|\()\s*"               # opening paren
     r"以下\s*"
     r"[「『｢\"]"                  # opening quote
-    r"(?P<label>[^」』｣\"]{1,20})"  # label (1-20 chars)
+    r"(?P<label>[^」』｣\"\r\n]{1,20})"  # label (1-20 chars)
     r"[」』｣\"]"                  # closing quote
     r"\s*という"
     r"\s*(?:。|）|\))",            # closing paren or period
@@ -75,7 +81,7 @@ PARTY_DEF_PAT = re.compile(
 ROLE_DEF_PAT = re.compile(
     r"以下\s*"
     r"[「『｢\"]"
-    r"(?P<label>[^」』｣\"]{1,20})"
+    r"(?P<label>[^」』｣\"\r\n]{1,20})"
     r"[」』｣\"]"
     r"\s*という",
     re.MULTILINE,
@@ -84,7 +90,7 @@ ROLE_DEF_PAT = re.compile(
 # Pattern 3: 「甲」（XX株式会社）  — reverse order
 REVERSE_PARTY_PAT = re.compile(
     r"[「『｢\"]"
-    r"(?P<label>[^」』｣\"]{1,10})"
+    r"(?P<label>[^」』｣\"\r\n]{1,10})"
     r"[」』｣\"]\s*"
     r"(?:（|\()\s*"
     r"(?P<entity>.{2,60}?)"
@@ -92,6 +98,12 @@ REVERSE_PARTY_PAT = re.compile(
     re.MULTILINE,
 )
 
+# Opening quotes the label of every party pattern starts with
+_OPEN_QUOTES = ("「", "『", "｢", "\"")
+
+# Role prefix in front of an entity name: 委託者・XX株式会社 (see _clean_entity_name)
+_ROLE_PREFIX_RE = re.compile(r"^(?:委託者|受託者|売主|買主|貸主|借主|甲|乙)[・:：]?\s*")
+
 # Common role names used in Japanese contracts
 KNOWN_ROLE_NAMES = {
     "委託者", "受託者",
@@ -119,30 +131,59 @@ STRUCTURAL_TERMS = {
 }
 
 
+# Classification is done on normalize_term(label), so fullwidth/halfwidth
+# or spacing variants (ﾗｲｾﾝｻｰ, 本 契約) match the canonical names. The sets
+# are normalized once here instead of per match.
+_TRADITIONAL_N = frozenset(normalize_term(t) for t in TRADITIONAL_LABELS)
+_KNOWN_ROLE_N = frozenset(normalize_term(t) for t in KNOWN_ROLE_NAMES)
+_STRUCTURAL_N = frozenset(normalize_term(t) for t in STRUCTURAL_TERMS)
+
+# Position of a label defined by pattern 1 (keyed by normalized label).
+# Built lowest precedence first so that 甲/乙/丙/丁 (also role names)
+# resolve to themselves.
+_POSITION_OF: Dict[str, str] = {
+    **{t: "structural" for t in _STRUCTURAL_N},
+    **{t: "role" for t in _KNOWN_ROLE_N},
+    **{t: t for t in _TRADITIONAL_N},
+}
+
+
 # ---------------------------------------------------------------------------
 # Extraction logic
 # ---------------------------------------------------------------------------
 
 
+def _strip_label(label: str) -> str:
+    # Labels rarely carry whitespace inside the quotes; only strip (and
+    # allocate) when an edge character actually is whitespace.
+    if label and (label[0].isspace() or label[-1].isspace()):
+        return label.strip()
+    return label
+
+
+_LEAD_JUNK = ("と", "及び", "および", "・", "、", "，", "\n", "\r", "）", ")")
+_TRAIL_PARTICLES = ("は", "が", "の", "を", "に", "と")
+
+
 def _clean_entity_name(s: str) -> str:
     """Clean up an entity name extracted from a party definition."""
     s = s.strip()
 
     # Remove common role prefixes like "委託者・" "受託者・"
-    role_prefix_pat = re.compile(r"^(?:委託者|受託者|売主|買主|貸主|借主|甲|乙)[・:：]?\s*")
-    s = role_prefix_pat.sub("", s).strip()
+    s = _ROLE_PREFIX_RE.sub("", s).strip()
+
+    # Most names have no junk at either end: one C-level tuple check each
+    if not (s.startswith(_LEAD_JUNK) or s.endswith(_TRAIL_PARTICLES)):
+        return s
 
     # Loop: strip leading/trailing junk until stable
     prev = None
     while prev != s:
         prev = s
-        for prefix in [
-            "と", "及び", "および", "・", "、", "，",
-            "\n", "\r", "）", ")",
-        ]:
+        for prefix in _LEAD_JUNK:
             while s.startswith(prefix) and len(s) > len(prefix):
                 s = s[len(prefix):].strip()
-        for suffix in ["は", "が", "の", "を", "に", "と"]:
+        for suffix in _TRAIL_PARTICLES:
             if s.endswith(suffix) and len(s) > 2:
                 s = s[:-len(suffix)].strip()
     return s
@@ -172,11 +213,28 @@ def extract_parties_full(
     head = text[:max_scan_chars]
     result = PartyExtractionResult()
     seen_labels: set = set()
+    # allowlist_labels は順序付きで重複なし。判定は集合で行う
+    seen_allowlist: set = set()
+
+    def _add_allow(label: str) -> None:
+        if label not in seen_allowlist:
+            seen_allowlist.add(label)
+            result.allowlist_labels.append(label)
+
+    # Every pattern needs an opening quote; patterns 1 and 2 also need a
+    # literal 以下. Substring tests (C fastsearch) decide which scans can
+    # match at all, so a head without them only gets the default labels.
+    # The three patterns are still scanned separately: their matches
+    # overlap (every pattern 1 hit contains a pattern 2 hit) and the passes
+    # run in a fixed order for seen_labels, which one combined alternation
+    # would not preserve.
+    has_quote = any(q in head for q in _OPEN_QUOTES)
+    has_ika = has_quote and "以下" in head
 
     # --- Pattern 1: Entity（以下「Label」という）---
-    for m in PARTY_DEF_PAT.finditer(head):
+    for m in PARTY_DEF_PAT.finditer(head) if has_ika else ():
         entity = _clean_entity_name(m.group("entity"))
-        label = (m.group("label") or "").strip()
+        label = _strip_label(m.group("label"))
 
         if not label or len(label) > 20:
             continue
@@ -184,14 +242,7 @@ def extract_parties_full(
             continue
         seen_labels.add(label)
 
-        if label in TRADITIONAL_LABELS:
-            position = label
-        elif label in KNOWN_ROLE_NAMES:
-            position = "role"
-        elif label in STRUCTURAL_TERMS:
-            position = "structural"
-        else:
-            position = "custom"
+        position = _POSITION_OF.get(normalize_term(label), "custom")
 
         defn = PartyDefinition(
             label=label,
@@ -201,18 +252,18 @@ def extract_parties_full(
             end=m.end(),
         )
         result.definitions.append(defn)
-        result.allowlist_labels.append(label)
+        _add_allow(label)
 
         if entity and len(entity) >= 2:
             result.all_entity_names.append(entity)
-            if label == "甲" or position == "role" and len(result.self_names) == 0:
+            if position == "甲" or position == "role" and len(result.self_names) == 0:
                 result.self_names.append(entity)
-            elif label == "乙":
+            elif position == "乙":
                 result.counter_names.append(entity)
 
     # --- Pattern 3: Reverse order 「Label」（Entity） ---
-    for m in REVERSE_PARTY_PAT.finditer(head):
-        label = (m.group("label") or "").strip()
+    for m in REVERSE_PARTY_PAT.finditer(head) if has_quote else ():
+        label = _strip_label(m.group("label"))
         entity = _clean_entity_name(m.group("entity"))
 
         if not label or label in seen_labels:
@@ -222,44 +273,42 @@ def extract_parties_full(
         defn = PartyDefinition(
             label=label,
             entity_name=entity if len(entity) >= 2 else "",
-            position=label if label in TRADITIONAL_LABELS else "custom",
+            position=label if normalize_term(label) in _TRADITIONAL_N else "custom",
             start=m.start(),
             end=m.end(),
         )
         result.definitions.append(defn)
-        result.allowlist_labels.append(label)
+        _add_allow(label)
 
         if entity and len(entity) >= 2:
             result.all_entity_names.append(entity)
 
     # --- Pattern 2: Standalone 以下「Label」という (no entity) ---
-    for m in ROLE_DEF_PAT.finditer(head):
-        label = (m.group("label") or "").strip()
+    for m in ROLE_DEF_PAT.finditer(head) if has_ika else ():
+        label = _strip_label(m.group("label"))
         if not label or label in seen_labels:
             continue
         seen_labels.add(label)
 
+        label_n = normalize_term(label)
         defn = PartyDefinition(
             label=label,
             entity_name="",
-            position="role" if label in KNOWN_ROLE_NAMES else "structural" if label in STRUCTURAL_TERMS else "custom",
+            position="role" if label_n in _KNOWN_ROLE_N else "structural" if label_n in _STRUCTURAL_N else "custom",
             start=m.start(),
             end=m.end(),
         )
         result.definitions.append(defn)
-        result.allowlist_labels.append(label)
+        _add_allow(label)
 
     # --- Always add traditional labels + structural terms to allowlist ---
     for t in TRADITIONAL_LABELS:
-        if t not in result.allowlist_labels:
-            result.allowlist_labels.append(t)
+        _add_allow(t)
 
     for t in STRUCTURAL_TERMS:
-        if t not in result.allowlist_labels:
-            result.allowlist_labels.append(t)
+        _add_allow(t)
 
     # --- Deduplicate ---
-    result.allowlist_labels = list(dict.fromkeys(result.allowlist_labels))
     result.self_names = list(dict.fromkeys(result.self_names))
     result.counter_names = list(dict.fromkeys(result.counter_names))
     result.all_entity_names = list(dict.fromkeys(result.all_entity_names))
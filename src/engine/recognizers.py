@@ -1,10 +1,16 @@
 from __future__ import annotations
+from functools import lru_cache
 from presidio_analyzer import PatternRecognizer, Pattern
 
 # All recognizers MUST specify supported_language="ja"
 # to match AnalyzerEngine(supported_languages=["ja"]).
+#
+# The patterns are constants, so each factory builds its recognizer once
+# (lru_cache) and repeated build_analyzer() calls share the instance and
+# its compiled regexes. Recognizers hold no per-analysis state.
 
 
+@lru_cache(maxsize=None)
 def make_email_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="EMAIL",
@@ -19,6 +25,7 @@ def make_email_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_phone_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="PHONE",
@@ -33,6 +40,7 @@ def make_phone_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_money_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="MONEY",
@@ -58,6 +66,7 @@ def make_money_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_postal_code_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="ID",
@@ -72,6 +81,7 @@ def make_postal_code_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_id_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="ID",
@@ -93,6 +103,7 @@ def make_id_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_person_name_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="PERSON",
@@ -112,25 +123,20 @@ def make_person_name_recognizer() -> PatternRecognizer:
                 score=0.86,
             ),
             # 担当:田中 / （担当:田中） のような“単独姓”にも対応
+            # NOTE:
+            #   括弧付き専用パターン（(担当:田中) / （担当:田中））は削除した。
+            #   それらの一致は必ずこのパターンでも同じ範囲・高いスコアで拾われ、
+            #   Presidio の remove_duplicates で捨てられていた（走査だけの無駄）。
             Pattern(
                 name="tanto_single_surname",
                 regex=r"(?<=担当[:：])[一-龥]{2,4}",
                 score=0.82,
             ),
-            Pattern(
-                name="tanto_single_surname_paren",
-                regex=r"(?<=\(担当[:：])[一-龥]{2,4}(?=\))",
-                score=0.80,
-            ),
-            Pattern(
-                name="tanto_single_surname_fwparen",
-                regex=r"(?<=（担当[:：])[一-龥]{2,4}(?=）)",
-                score=0.80,
-            ),
         ],
     )
 
 
+@lru_cache(maxsize=None)
 def make_age_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="ID",
@@ -152,6 +158,7 @@ def make_age_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_date_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="DATE",
@@ -171,20 +178,27 @@ def make_date_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_address_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="ADDRESS",
         supported_language="ja",
         patterns=[
+            # NOTE:
+            #   PatternRecognizer は DOTALL 付きでコンパイルするため、"." だと
+            #   住所の後ろの行（委託料・氏名など）まで 40 文字食い込んでいた。
+            #   [^\n] で行内に限定（FastRegexAnalyzer の "." と同じ挙動）。
+            #   探索幅も行末で打ち切られる。
             Pattern(
                 "addr_hint",
-                r"(..??[\u90FD\u9053\u5E9C\u770C].{1,30}?[\u5E02\u533A\u753A\u6751].{0,40})",
+                r"([^\n][^\n]??[\u90FD\u9053\u5E9C\u770C][^\n]{1,30}?[\u5E02\u533A\u753A\u6751][^\n]{0,40})",
                 0.55,
             )
         ],
     )
 
 
+@lru_cache(maxsize=None)
 def make_company_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="COMPANY",
@@ -209,6 +223,7 @@ def make_company_recognizer() -> PatternRecognizer:
     )
 
 
+@lru_cache(maxsize=None)
 def make_parties_recognizer() -> PatternRecognizer:
     return PatternRecognizer(
         supported_entity="PARTIES",
@@ -8,6 +8,11 @@ from .normalize import normalize_term
 class StableIdState:
     counters: Dict[str, int] = field(default_factory=dict)
     mapping: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    # (entity, original as written) -> label; skips NFKC normalization for
+    # repeats of the same surface form (e.g. one company name 50 times)
+    _by_surface: Dict[Tuple[str, str], str] = field(
+        default_factory=dict, repr=False
+    )
 
     @classmethod
     def create(cls) -> "StableIdState":
@@ -16,14 +21,26 @@ class StableIdState:
     def get_label(
         self, entity: str, original: str, label_format: Dict[str, str]
     ) -> str:
+        surface = (entity, original)
+        label = self._by_surface.get(surface)
+        if label is not None:
+            return label
+
         key = (entity, normalize_term(original))
         if key in self.mapping:
-            return self.mapping[key]
+            label = self.mapping[key]
+            self._by_surface[surface] = label
+            return label
 
         n = self.counters.get(entity, 0) + 1
         self.counters[entity] = n
 
-        fmt = label_format.get(entity, f"[{entity}_{{n:02d}}]")
-        label = fmt.format(n=n)
+        fmt = label_format.get(entity)
+        if fmt is None:
+            # default "[ENTITY_NN]": build directly, no format-string parse
+            label = f"[{entity}_{n:02d}]"
+        else:
+            label = fmt.format(n=n)
         self.mapping[key] = label
+        self._by_surface[surface] = label
         return label
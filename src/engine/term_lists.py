@@ -0,0 +1,38 @@
+from __future__ import annotations
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Tuple
+
+
+@lru_cache(maxsize=32)
+def _load_terms_cached(
+    path: str, stat_key: Tuple[int, int], limit: Optional[int]
+) -> Tuple[str, ...]:
+    """辞書ファイルを読み込み、長い順に並べた語のタプルを返す（キャッシュ層）
+
+    stat_key = (st_mtime_ns, st_size) はキャッシュキー専用。
+    ファイルが更新されると別キーになり、自動的に再読込される。
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = f.read()
+    it = (
+        t for t in (ln.strip() for ln in data.splitlines())
+        if t and not t.startswith("#")
+    )
+    terms = list(islice(it, limit))
+    # 安定ソートなので同じ長さの語はファイル順を保つ
+    return tuple(sorted(terms, key=len, reverse=True))
+
+
+def load_sorted_terms(
+    path: str, limit: Optional[int] = None
+) -> Tuple[str, ...]:
+    """コメント・空行を除いた語を長い順で返す。ファイルが無ければ空タプル。"""
+    try:
+        st = os.stat(path)
+        return _load_terms_cached(
+            os.path.abspath(path), (st.st_mtime_ns, st.st_size), limit
+        )
+    except FileNotFoundError:
+        return ()
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List
+import re
+from typing import AbstractSet, FrozenSet, Iterable, Union
 from .normalize import normalize_term
 
 MONEY_CTX_WORDS = [
@@ -9,6 +10,10 @@ MONEY_CTX_WORDS = [
     "支払", "請求", "入金", "振込",
     "売買代金", "委託料", "利用料", "料金",
 ]
+# 文脈語のどれか 1 つを 1 回の走査で探す（長い語を先に置く）
+_MONEY_CTX_RE = re.compile(
+    "|".join(map(re.escape, sorted(MONEY_CTX_WORDS, key=len, reverse=True)))
+)
 
 
 def has_money_context(
@@ -16,15 +21,28 @@ def has_money_context(
 ) -> bool:
     s = max(0, start - window)
     e = min(len(text), end + window)
-    ctx = text[s:e]
-    return any(w in ctx for w in MONEY_CTX_WORDS)
+    # pos/endpos で窓を指定するので部分文字列を切り出さない
+    return _MONEY_CTX_RE.search(text, s, e) is not None
 
 
-def in_list(term: str, allowlist: List[str]) -> bool:
+def in_list(
+    term: str, allowlist: Union[AbstractSet[str], Iterable[str]]
+) -> bool:
+    """term が allowlist に（正規化後の完全一致で）含まれるか
+
+    集合（set / frozenset）は normalized_set() で正規化済みとみなし、
+    O(1) で判定する。リスト等を渡した場合はその場で正規化集合を作る。
+    """
     t = normalize_term(term)
     if not t:
         return False
-    for a in allowlist:
-        if t == normalize_term(a):
-            return True
-    return False
+    if not isinstance(allowlist, AbstractSet):
+        allowlist = normalized_set(allowlist)
+    return t in allowlist
+
+
+def normalized_set(allowlist: Iterable[str]) -> FrozenSet[str]:
+    """allowlist を正規化済み集合に変換（in_list と同じ判定を O(1) で行う用）"""
+    terms = {normalize_term(a) for a in allowlist}
+    terms.discard("")  # in_list は空語を一致扱いしない
+    return frozenset(terms)
@@ -20,24 +20,26 @@ Features added/fixed vs previous version:
 from __future__ import annotations
 
 import os
+import queue
+import re
 import sys
 import threading
-import webbrowser
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, Menu
+from tkinter import font as tkfont
 
-from app_controller import AppController
-from engine.masking_engine import MaskingEngine, BLACK_CHAR
-from report.report_exporter import export_html_side_by_side
-from report.ui_payload import load_json, build_review_payload, save_json
-from policy.policy_update import apply_user_actions
-from policy.audit_log import append_audit_log
 from log_bus import LogBus
 
+# Backend modules (engine, controller, report, policy) are imported where
+# they are used, so the window can be drawn before spaCy & co. are loaded.
+
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 if getattr(sys, "frozen", False):
@@ -74,9 +76,16 @@ class Detection:
     enabled: bool = True
     mask_override: Optional[str] = None
     is_review: bool = False
+    # list row texts and lowercased search haystack, filled by
+    # _prepare_display()
+    title_text: str = ""
+    disp_text: str = ""
+    search_text: str = ""
+    # memo of MaskingApp._replacement_for: (key, replacement)
+    _repl_memo: Tuple[Optional[tuple], str] = field(default=(None, ""), repr=False)
 
 
-_ENTITY_ICON = {
+_ENTITY_ICON = MappingProxyType({
     "PERSON": "👤", "NAME": "👤",
     "COMPANY": "🏢", "ORG": "🏢",
     "ADDRESS": "🏠", "LOCATION": "🏠",
@@ -84,11 +93,57 @@ _ENTITY_ICON = {
     "ID": "🆔", "DATE": "📅",
     "MONEY": "💰", "CUSTOM": "🏷️",
     "KEYWORD": "🔑",
-}
+})
+_ICON_GET = _ENTITY_ICON.get
+
+
+# right-click menu entries: (label, entity type)
+_CONTEXT_CATEGORIES = (
+    ("👤 氏名", "PERSON"),
+    ("🏢 法人名", "COMPANY"),
+    ("🏠 住所", "ADDRESS"),
+    ("🆔 ID/番号", "ID"),
+    ("📧 メール", "EMAIL"),
+    ("📞 電話", "PHONE"),
+    ("📅 日付", "DATE"),
+    ("💰 金額", "MONEY"),
+    ("🏷️ 任意", "CUSTOM"),
+)
+
+# right-click token selection: a token is a run of non-stop characters
+_TOKEN_STOP_CHARS = (
+    " \t\r\n　,，.。．、:：;；()（）[]【】{}「」『』<>＜＞\"'""''|｜/／\\\\'・"
+)
+_TOKEN_CLASS = "[^" + "".join(re.escape(c) for c in sorted(set(_TOKEN_STOP_CHARS))) + "]"
+_TOKEN_RUN_RE = re.compile(_TOKEN_CLASS + "*")
+# searched with endpos: the run that ends exactly at endpos
+_TOKEN_TAIL_RE = re.compile(_TOKEN_CLASS + "*\\Z")
+_TOKEN_MAX_REACH = 80
 
 
 def _icon_for(entity: str) -> str:
-    return _ENTITY_ICON.get((entity or "").upper(), "🔎")
+    return _ICON_GET(entity.upper() if entity else "", "🔎")
+
+
+# characters outside the BMP (e.g. 𠮷 in names); Tcl 8.6 stores them as a
+# UTF-16 surrogate pair, so they take two columns in a Tk text index
+_ASTRAL_RE = re.compile("[\U00010000-\U0010FFFF]")
+
+
+def _tk_width(s: str, astral_extra: int) -> int:
+    """Length of s in Tk text index columns (astral_extra: see MaskingApp)."""
+    n = len(s)
+    if astral_extra and not s.isascii():
+        n += astral_extra * len(_ASTRAL_RE.findall(s))
+    return n
+
+
+def _same_path(a: str, b: str) -> bool:
+    """True if a and b name the same file (either may not exist yet)."""
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
 
 
 def _short(s: str, n: int = 28) -> str:
@@ -96,26 +151,61 @@ def _short(s: str, n: int = 28) -> str:
     return (s[: n - 1] + "…") if len(s) > n else s
 
 
+def _prepare_display(d: Detection) -> Detection:
+    """Precompute the list row texts (call again if entity_type changes)."""
+    d.title_text = f"{_icon_for(d.entity_type)} {d.entity_type}" + ("  ⚠" if d.is_review else "")
+    d.disp_text = _short(d.original, 32)
+    # "\0" keeps a query from matching across two fields
+    d.search_text = f"{d.entity_type or ''}\0{d.original or ''}\0{d.reason or ''}".lower()
+    return d
+
+
+def _item_value(d: Detection) -> str:
+    if d.mask_override:
+        return f"{d.disp_text} → {_short(d.mask_override, 20)}"
+    return d.disp_text
+
+
 # ---------------------------------------------------------------------------
-# Detection list item widget
+# Detection list rows (drawn on one shared canvas)
 # ---------------------------------------------------------------------------
 
+# (label, action, fill, text color, hover fill)
+_ROW_BUTTONS = (
+    ("残す(今回)", "KEEP_ONCE", "#e8f5e9", "#2e7d32", "#c8e6c9"),
+    ("消す(今回)", "MASK_ONCE", "#fce4ec", "#c62828", "#f8bbd0"),
+    ("常に残す", "ALWAYS_KEEP", "#e0f2f1", "#00695c", "#b2dfdb"),
+    ("常にCO.マスク", "ALWAYS_MASK_AS_COMPANY", "#fff3e0", "#e65100", "#ffe0b2"),
+)
+_ROW_ACTIONS = frozenset(b[1] for b in _ROW_BUTTONS)
+
+_ROW_BG = "#fafafa"
+_ROW_BG_ACTIVE = "#e3f2fd"
+_SWITCH_ON = "#1a237e"
+_SWITCH_OFF = "#b0bec5"
+
+
+class DetectionRowRenderer:
+    """Draws detection rows as plain items on a shared tk.Canvas.
+
+    A row used to be a CTkFrame with labels, five buttons and a switch,
+    each composited on its own canvas. Here every row is ~15 canvas items
+    tagged ("row", "r<i>", <part>); clicks and hover are handled by one set
+    of canvas bindings that map the pointer to a row by its y coordinate
+    and to a part by the tags of the item under it.
+    """
 
-class DetectionListItem(ctk.CTkFrame):
     def __init__(
         self,
-        master,
-        detection: Detection,
+        canvas: tk.Canvas,
         on_toggle,
         on_select,
         on_edit,
         on_hover,
         on_leave,
         on_action,
-        **kwargs,
     ):
-        super().__init__(master, **kwargs)
-        self.d = detection
+        self.canvas = canvas
         self.on_toggle = on_toggle
         self.on_select = on_select
         self.on_edit = on_edit
@@ -123,97 +213,177 @@ class DetectionListItem(ctk.CTkFrame):
         self.on_leave = on_leave
         self.on_action = on_action
 
-        self.configure(fg_color="transparent", corner_radius=0)
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_columnconfigure(1, weight=0)
-
-        # -- info area --
-        info = ctk.CTkFrame(self, fg_color="transparent")
-        info.grid(row=0, column=0, sticky="nsew", padx=(10, 5), pady=6)
-        title = f"{_icon_for(detection.entity_type)} {detection.entity_type}"
-        if detection.is_review:
-            title += "  ⚠"
-        self.lbl_t = ctk.CTkLabel(
-            info, text=title, font=("", 11, "bold"),
-            anchor="w", text_color="#1a237e",
+        # row index -> detection, and detection id -> row index
+        self.rows: Dict[int, Detection] = {}
+        self.row_of: Dict[int, int] = {}
+        self._hover_id: Optional[int] = None
+
+        # CTk sizes fonts in (scaled) pixels; do the same so rows match
+        # the rest of the UI
+        try:
+            sc = ctk.ScalingTracker.get_widget_scaling(canvas)
+        except Exception:
+            sc = 1.0
+        self._sc = sc
+        family = tkfont.nametofont("TkDefaultFont").actual("family")
+        self.font_title = tkfont.Font(root=canvas, family=family, size=-round(11 * sc), weight="bold")
+        self.font_value = tkfont.Font(root=canvas, family=family, size=-round(11 * sc))
+        self.font_button = tkfont.Font(root=canvas, family=family, size=-round(9 * sc))
+
+        # fixed layout (relative to the row top)
+        px = lambda v: round(v * sc)  # noqa: E731
+        self._pad = px(10)
+        self._title_y = px(6)
+        self._value_y = self._title_y + self.font_title.metrics("linespace") + px(2)
+        info_bottom = self._value_y + self.font_value.metrics("linespace")
+        self._ctl_h = px(22)
+        self._ctl_y = max(px(6), (self._title_y + info_bottom - self._ctl_h) // 2)
+        self._edit_w = px(28)
+        self._switch_w = px(40)
+        self._btn_y = max(info_bottom, self._ctl_y + self._ctl_h) + px(6)
+        self._btn_h = max(px(22), self.font_button.metrics("linespace") + px(6))
+        self._btn_widths = [
+            self.font_button.measure(label) + px(14) for label, *_ in _ROW_BUTTONS
+        ]
+        self.row_height = self._btn_y + self._btn_h + px(5)
+
+        canvas.bind("<Button-1>", self._on_click)
+        canvas.bind("<Motion>", self._on_motion)
+        canvas.bind("<Leave>", self._on_leave)
+
+    # -- drawing --
+
+    def draw(self, i: int, d: Detection, width: int, active: bool = False):
+        c = self.canvas
+        top = i * self.row_height
+        r = f"r{i}"
+        pad = self._pad
+
+        c.create_rectangle(
+            0, top, width, top + self.row_height,
+            fill=_ROW_BG_ACTIVE if active else _ROW_BG, width=0,
+            tags=("row", r, "bg"),
         )
-        self.lbl_t.pack(fill="x")
-
-        disp = _short(detection.original, 32)
-        if detection.mask_override:
-            disp += f" → {_short(detection.mask_override, 20)}"
-        self.lbl_v = ctk.CTkLabel(
-            info, text=disp, font=("", 11),
-            anchor="w", text_color="#546e7a",
+        c.create_text(
+            pad, top + self._title_y, text=d.title_text, anchor="nw",
+            font=self.font_title, fill="#1a237e", tags=("row", r),
+        )
+        c.create_text(
+            pad, top + self._value_y, text=_item_value(d), anchor="nw",
+            font=self.font_value, fill="#546e7a", tags=("row", r, "value"),
         )
-        self.lbl_v.pack(fill="x")
-
-        # -- action buttons + toggle --
-        act = ctk.CTkFrame(self, fg_color="transparent")
-        act.grid(row=0, column=1, sticky="nse", padx=(5, 10), pady=6)
 
-        ctk.CTkButton(
-            act, text="✎", width=28, height=24,
-            command=lambda: self.on_edit(self.d),
-            fg_color="#cfd8dc", text_color="#1a237e", hover_color="#b0bec5",
-        ).pack(side="left", padx=1)
-
-        self.sw = ctk.CTkSwitch(
-            act, text="", width=40,
-            command=self._toggle,
-            progress_color="#1a237e",
+        # edit button + switch, right aligned
+        sx1 = width - pad
+        sx0 = sx1 - self._switch_w
+        ex1 = sx0 - round(4 * self._sc)
+        ex0 = ex1 - self._edit_w
+        y0 = top + self._ctl_y
+        y1 = y0 + self._ctl_h
+        c.create_rectangle(
+            ex0, y0, ex1, y1, fill="#cfd8dc", activefill="#b0bec5", width=0,
+            tags=("row", r, "edit"),
+        )
+        c.create_text(
+            (ex0 + ex1) // 2, (y0 + y1) // 2, text="✎", font=self.font_value,
+            fill="#1a237e", tags=("row", r, "edit"),
         )
-        self.sw.pack(side="left", padx=2)
-        if self.d.enabled:
-            self.sw.select()
+        c.create_rectangle(sx0, y0 + 3, sx1, y1 - 3, width=0, tags=("row", r, "switch", "sw_track"))
+        c.create_oval(0, 0, 0, 0, fill="#ffffff", outline="", tags=("row", r, "switch", "sw_knob"))
+        self._draw_switch(i, d.enabled)
+
+        # action buttons row
+        x = pad
+        by0 = top + self._btn_y
+        by1 = by0 + self._btn_h
+        for (label, action, fill, fg, hover), w in zip(_ROW_BUTTONS, self._btn_widths):
+            c.create_rectangle(
+                x, by0, x + w, by1, fill=fill, activefill=hover, width=0,
+                tags=("row", r, action),
+            )
+            c.create_text(
+                x + w // 2, (by0 + by1) // 2, text=label, font=self.font_button,
+                fill=fg, tags=("row", r, action),
+            )
+            x += w + round(2 * self._sc)
 
-        # -- action buttons row --
-        btn_row = ctk.CTkFrame(self, fg_color="transparent")
-        btn_row.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 4))
+        # separator
+        bottom = top + self.row_height - 1
+        c.create_line(0, bottom, width, bottom, fill="#e0e0e0", tags=("row", r))
 
-        btn_style = dict(height=22, font=("", 9), corner_radius=4)
-        ctk.CTkButton(
-            btn_row, text="残す(今回)", width=68,
-            command=lambda: self.on_action(self.d, "KEEP_ONCE"),
-            fg_color="#e8f5e9", text_color="#2e7d32", hover_color="#c8e6c9",
-            **btn_style,
-        ).pack(side="left", padx=1)
-        ctk.CTkButton(
-            btn_row, text="消す(今回)", width=68,
-            command=lambda: self.on_action(self.d, "MASK_ONCE"),
-            fg_color="#fce4ec", text_color="#c62828", hover_color="#f8bbd0",
-            **btn_style,
-        ).pack(side="left", padx=1)
-        ctk.CTkButton(
-            btn_row, text="常に残す", width=62,
-            command=lambda: self.on_action(self.d, "ALWAYS_KEEP"),
-            fg_color="#e0f2f1", text_color="#00695c", hover_color="#b2dfdb",
-            **btn_style,
-        ).pack(side="left", padx=1)
-        ctk.CTkButton(
-            btn_row, text="常にCO.マスク", width=82,
-            command=lambda: self.on_action(self.d, "ALWAYS_MASK_AS_COMPANY"),
-            fg_color="#fff3e0", text_color="#e65100", hover_color="#ffe0b2",
-            **btn_style,
-        ).pack(side="left", padx=1)
-
-        # -- separator --
-        ctk.CTkFrame(self, height=1, fg_color="#e0e0e0").grid(
-            row=2, column=0, columnspan=2, sticky="ew"
-        )
+        self.rows[i] = d
+        self.row_of[d.id] = i
 
-        # click / hover bindings
-        for w in (self, info, self.lbl_t, self.lbl_v):
-            w.bind("<Button-1>", lambda e: self.on_select(self.d.id))
-            w.bind("<Enter>", lambda e: self.on_hover(self.d.id))
-            w.bind("<Leave>", lambda e: self.on_leave())
+    def _draw_switch(self, i: int, on: bool):
+        c = self.canvas
+        r = f"r{i}"
+        coords = c.coords(f"{r}&&sw_track")
+        if not coords:
+            return
+        x0, y0, x1, y1 = coords
+        c.itemconfigure(f"{r}&&sw_track", fill=_SWITCH_ON if on else _SWITCH_OFF)
+        m = 2
+        d = (y1 - y0) - 2 * m
+        kx = x1 - m - d if on else x0 + m
+        c.coords(f"{r}&&sw_knob", kx, y0 + m, kx + d, y0 + m + d)
+
+    def erase(self, i: int):
+        self.canvas.delete(f"r{i}")
+        d = self.rows.pop(i, None)
+        if d is not None and self.row_of.get(d.id) == i:
+            del self.row_of[d.id]
+
+    def clear(self):
+        self.canvas.delete("row")
+        self.rows.clear()
+        self.row_of.clear()
+
+    def set_highlight(self, det_id: int, active: bool):
+        i = self.row_of.get(det_id)
+        if i is not None:
+            self.canvas.itemconfigure(
+                f"r{i}&&bg", fill=_ROW_BG_ACTIVE if active else _ROW_BG
+            )
+
+    # -- events --
+
+    def _row_at(self, y: int) -> Optional[int]:
+        i = int(self.canvas.canvasy(y)) // self.row_height
+        return i if i in self.rows else None
+
+    def _on_click(self, event):
+        i = self._row_at(event.y)
+        if i is None:
+            return
+        d = self.rows[i]
+        tags = self.canvas.gettags("current")
+        if "edit" in tags:
+            self.on_edit(d)
+        elif "switch" in tags:
+            d.enabled = not d.enabled
+            self._draw_switch(i, d.enabled)
+            self.on_toggle()
+        else:
+            action = next((t for t in tags if t in _ROW_ACTIONS), None)
+            if action:
+                self.on_action(d, action)
+            else:
+                self.on_select(d.id)
 
-    def _toggle(self):
-        self.d.enabled = bool(self.sw.get())
-        self.on_toggle()
+    def _on_motion(self, event):
+        i = self._row_at(event.y)
+        det_id = self.rows[i].id if i is not None else None
+        if det_id == self._hover_id:
+            return
+        self._hover_id = det_id
+        self.on_leave()
+        if det_id is not None:
+            self.on_hover(det_id)
 
-    def set_highlight(self, active: bool):
-        self.configure(fg_color="#e3f2fd" if active else "transparent")
+    def _on_leave(self, event=None):
+        if self._hover_id is not None:
+            self._hover_id = None
+            self.on_leave()
 
 
 # ---------------------------------------------------------------------------
@@ -225,6 +395,13 @@ class MaskingApp(ctk.CTk):
     def __init__(self):
         super().__init__()
 
+        # 1 if this Tcl counts a non-BMP character as two index columns
+        # (8.6, UTF-16 internally), 0 if as one (Tcl 9)
+        try:
+            self._tk_astral_extra = int(self.tk.call("string", "length", "\U00020BB7")) - 1
+        except Exception:
+            self._tk_astral_extra = 1
+
         self.title("Legal Masking Tool v1.0 — Legal GPT編集部")
         self.geometry("1440x920")
 
@@ -240,11 +417,115 @@ class MaskingApp(ctk.CTk):
 
         # -- LogBus --
         self.log_bus = LogBus()
+        # log panel keeps at most ~_log_max_lines lines (trimmed in bulk)
+        self._log_max_lines = 1000
+        self._log_lines = 0
+        self._log_drain_max = 128
+        # poll interval: 50ms while messages flow, backing off to 500ms idle
+        self._log_poll_ms = 50
+        self._log_idle_streak = 0
+        self._log_after_id: Optional[str] = None
 
         # -- backend --
+        #   The engine (spaCy/GiNZA/Presidio) is imported and built by
+        #   _init_backend once the window is on screen.
         self.policy_path = os.path.join(BASE_DIR, "resources", "masking_policy.yaml")
+        self.engine = None
+        self.controller = None
+
+        # -- I/O pool: independent output files of a save are written in parallel --
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lm-io")
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # -- state --
+        self.current_file: Optional[str] = None
+        self.original_text: str = ""
+        # offset of the first char of each line of original_text (+ end)
+        self._line_starts: List[int] = [0, 1]
+        self.masked_text: str = ""
+        self.report: Dict[str, Any] = {}
+        self.payload: Optional[Dict[str, Any]] = None
+        self.last_result = None
+
+        self.use_blackout: bool = False
+        # part of every Detection._repl_memo key; bump to drop all memos
+        self._repl_version: int = 0
+        # inputs of the last _render_texts (original text, mode, enabled spans)
+        self._render_cache_key: Optional[tuple] = None
+        self.show_review_only: bool = True
+        self.search_query: str = ""
+        self._search_after_id: Optional[str] = None
+        self._toast_win: Optional[ctk.CTkToplevel] = None
+        self._toast_after: Optional[str] = None
+
+        self.detections: List[Detection] = []
+        # bumped on every change to self.detections or a detection in it
+        self._det_version: int = 0
+        self._overrides_cache: tuple = (-1, [], [], [])
+        self._enabled_cache: Tuple[int, List[Detection]] = (-1, [])
+        # ids are never reused or renumbered; manual adds take the next one
+        self._next_det_id: int = 1
+
+        # -- search index --
+        #   last (review_only, query) -> matches, so a query that extends the
+        #   previous one only re-filters the previous matches (the haystacks
+        #   themselves are Detection.search_text)
+        # -- position index over self.detections (rebuilt on change) --
+        self._det_starts: List[int] = []
+        self._det_order: List[Detection] = []
+        self._det_by_id: Dict[int, Detection] = {}
+        self._last_filter: Optional[Tuple[bool, str]] = None
+        self._last_matches: List[Detection] = []
+
+        # -- detection list (virtualized) --
+        #   Only the rows in view (plus a few above/below) are drawn on the
+        #   list canvas; scrolling draws/erases rows at the edges and
+        #   filtering only swaps _list_dets.
+        self._list_dets: List[Detection] = []
+        self._highlighted: Set[int] = set()
+        self._list_overscan: int = 3
+
+        # -- masked-text hover: handled at most every ~33ms (latest event) --
+        self._hover_pending: Optional[tk.Event] = None
+        self._hover_after: Optional[str] = None
+        self._hover_det_id: Optional[int] = None
+
+        self._create_ui()
+
+        # -- worker -> UI marshalling: callables queued by worker threads,
+        #    run on the Tk thread in one pass per <<UIUpdate>> --
+        self._ui_queue: queue.Queue = queue.Queue()
+        self.bind("<<UIUpdate>>", self._drain_ui_queue)
+
+        # start log bus polling; a burst after an idle period wakes the
+        # poller right away instead of waiting out the backoff
+        self.bind("<<LogMessage>>", self._on_log_message)
+        self.log_bus.set_notify(
+            lambda: self.event_generate("<<LogMessage>>", when="tail")
+        )
+        self._poll_log_bus()
+
+        self._set_status("loading engine...")
+        self.after(100, self._init_backend)
+
+    # ======================================================================
+    # Backend
+    # ======================================================================
+
+    def _init_backend(self):
+        """Import and build the engine after the empty window has been drawn.
+
+        Importing engine.masking_engine pulls in spaCy/GiNZA/Presidio, which
+        dominated the time before anything was shown.
+        """
+        self.update_idletasks()
         self.log_bus.emit("loading engine...")
+        AppController = None
         try:
+            # imported here so that a broken install gets the same dialog
+            from app_controller import AppController
+            from engine.masking_engine import MaskingEngine
+
             self.engine = MaskingEngine(self.policy_path, base_dir=BASE_DIR, log_fn=self.log_bus.emit)
             if not self.engine.nlp_available:
                 self.log_bus.emit("WARNING: NLP not loaded. Using regex-only mode.")
@@ -264,28 +545,10 @@ class MaskingApp(ctk.CTk):
                 f"Engine failed to initialize:\n\n{init_err}",
             )
             self.engine = None
-        self.controller = AppController(BASE_DIR, self.engine, log_fn=self.log_bus.emit)
+        if AppController is not None:
+            self.controller = AppController(BASE_DIR, self.engine, log_fn=self.log_bus.emit)
         self.log_bus.emit("engine ready")
-
-        # -- state --
-        self.current_file: Optional[str] = None
-        self.original_text: str = ""
-        self.masked_text: str = ""
-        self.report: Dict[str, Any] = {}
-        self.payload: Optional[Dict[str, Any]] = None
-        self.last_result = None
-
-        self.use_blackout: bool = False
-        self.show_review_only: bool = True
-        self.search_query: str = ""
-
-        self.detections: List[Detection] = []
-        self.det_items: Dict[int, DetectionListItem] = {}
-
-        self._create_ui()
-
-        # start log bus polling
-        self._poll_log_bus()
+        self._set_status("ready")
 
     # ======================================================================
     # UI construction
@@ -368,8 +631,34 @@ class MaskingApp(ctk.CTk):
         self.view_switch.set("要確認")
         self.view_switch.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
 
-        self.scroll = ctk.CTkScrollableFrame(left, fg_color="transparent")
-        self.scroll.grid(row=2, column=0, sticky="nsew", padx=0, pady=0)
+        list_frame = ctk.CTkFrame(left, fg_color="transparent")
+        list_frame.grid(row=2, column=0, sticky="nsew", padx=0, pady=0)
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+
+        self.list_canvas = tk.Canvas(
+            list_frame, bg="#fafafa", highlightthickness=0, bd=0,
+            yscrollincrement=20,
+        )
+        self.list_canvas.grid(row=0, column=0, sticky="nsew")
+        self.list_scrollbar = ctk.CTkScrollbar(list_frame, command=self.list_canvas.yview)
+        self.list_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.list_canvas.configure(yscrollcommand=self._on_list_yview)
+        self.list_canvas.bind("<Configure>", self._on_list_configure)
+        self._list_empty_id = self.list_canvas.create_text(
+            10, 10, text="該当なし", fill="#546e7a", anchor="nw", state="hidden",
+        )
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.list_canvas.bind(seq, self._on_list_wheel)
+        self.list_rows = DetectionRowRenderer(
+            self.list_canvas,
+            on_toggle=self._toggle_changed,
+            on_select=self._select_detection,
+            on_edit=self._edit_detection,
+            on_hover=self._hover_from_list,
+            on_leave=self._leave_all,
+            on_action=self._on_detection_action,
+        )
 
         # -- text areas --
         font_name = ("Consolas", 13) if sys.platform == "win32" else ("", 13)
@@ -386,8 +675,26 @@ class MaskingApp(ctk.CTk):
         )
         self.m_text.grid(row=0, column=2, sticky="nsew", padx=4)
 
+        # both panes are display-only and rewritten wholesale by
+        # _render_texts: no undo stack, no blinking insert cursor, and
+        # disabled except while _render_texts writes (selection, tags and
+        # the context menu still work on a disabled text widget)
+        for tb in (self.o_text, self.m_text):
+            tb._textbox.configure(
+                undo=False, autoseparators=False, maxundo=0,
+                insertontime=0, blockcursor=False, takefocus=0,
+                state="disabled",
+            )
+
         # -- context menu for right-click add --
         self.context_menu = Menu(self, tearoff=0, font=("", 10))
+        for lbl, ent in _CONTEXT_CATEGORIES:
+            self.context_menu.add_command(
+                label=lbl,
+                command=lambda e=ent: self._quick_add_range(e),
+            )
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="➕ 詳細設定…", command=self._manual_add)
         self._ctx_range: Optional[Tuple[int, int, str]] = None
         self._bind_context_menu(self.o_text, self._show_context_menu)
 
@@ -398,7 +705,7 @@ class MaskingApp(ctk.CTk):
         # -- masked hover highlight --
         self.m_text.tag_config("highlight", underline=True)
         self.m_text._textbox.bind("<Motion>", self._masked_hover)
-        self.m_text._textbox.bind("<Leave>", lambda e: self._leave_all())
+        self.m_text._textbox.bind("<Leave>", self._masked_leave)
 
         # -- log panel --
         log_frame = ctk.CTkFrame(self, height=100, fg_color="#fafafa", corner_radius=0)
@@ -416,6 +723,7 @@ class MaskingApp(ctk.CTk):
             fg_color="#ffffff", border_width=1, border_color="#e0e0e0",
         )
         self.log_text.grid(row=1, column=0, sticky="ew", padx=10, pady=(2, 6))
+        self.log_text._textbox.configure(undo=False, autoseparators=False, maxundo=0)
 
         # -- status bar --
         status = ctk.CTkFrame(self, height=30, fg_color="#eeeeee", corner_radius=0)
@@ -429,43 +737,118 @@ class MaskingApp(ctk.CTk):
         )
         self.status_right.pack(side="right", padx=20)
 
+    def _on_close(self):
+        self._close_toast()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     # ======================================================================
     # Log bus polling
     # ======================================================================
 
     def _poll_log_bus(self):
-        msgs = self.log_bus.drain()
-        if msgs:
-            for m in msgs:
-                self.log_text.insert("end", m + "\n")
-            self.log_text.see("end")
-        self.after(150, self._poll_log_bus)
+        self._log_after_id = None
+        if not self._ui_queue.empty():
+            self._drain_ui_queue()
+        # bounded per poll so a chatty worker cannot stall the event loop;
+        # the rest is picked up by the next (50 ms) poll
+        blob, n = self.log_bus.drain_text(self._log_drain_max)
+        if n:
+            self._log_idle_streak = 0
+            self._log_poll_ms = 50
+            # follow the tail only if the user has not scrolled up
+            follow = self.log_text.yview()[1] > 0.98
+            self.log_text.insert("end", blob)
+            self._log_lines += blob.count("\n")
+            if self._log_lines > self._log_max_lines * 1.2:
+                drop = self._log_lines - self._log_max_lines
+                self.log_text.delete("1.0", f"{drop + 1}.0")
+                self._log_lines = self._log_max_lines
+            if follow:
+                self.log_text.see("end")
+        else:
+            self._log_idle_streak += 1
+            self._log_poll_ms = min(500, 50 * (2 ** min(self._log_idle_streak, 4)))
+        self._log_after_id = self.after(self._log_poll_ms, self._poll_log_bus)
+
+    def _on_log_message(self, event=None):
+        if self._log_after_id is not None:
+            self.after_cancel(self._log_after_id)
+        self._poll_log_bus()
 
     # ======================================================================
-    # Offset utilities (BUG FIX: now a proper class method)
+    # Worker -> UI marshalling
     # ======================================================================
 
-    def _offset_from_index(self, index: str) -> int:
-        """Convert a Tk text index ('line.char') to a character offset from '1.0'."""
+    def _post_ui(self, fn):
+        """Run `fn` on the Tk thread (safe to call from worker threads)."""
+        self._ui_queue.put(fn)
         try:
-            count = self.o_text._textbox.count("1.0", index, "chars")
-            if count is None:
-                return 0
-            if isinstance(count, (list, tuple)):
-                return int(count[0])
-            return int(count)
+            self.event_generate("<<UIUpdate>>", when="tail")
         except Exception:
-            # fallback: parse 'line.col' manually
+            pass  # picked up by the next log poll
+
+    def _drain_ui_queue(self, event=None):
+        while True:
             try:
-                parts = str(index).split(".")
-                line = int(parts[0])
-                col = int(parts[1]) if len(parts) > 1 else 0
-                text = self.original_text or ""
-                lines = text.split("\n")
-                offset = sum(len(lines[i]) + 1 for i in range(min(line - 1, len(lines))))
-                return offset + col
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
             except Exception:
-                return 0
+                self.report_callback_exception(*sys.exc_info())
+
+    # ======================================================================
+    # Offset utilities (BUG FIX: now a proper class method)
+    # ======================================================================
+
+    def _offset_from_index(self, index: str) -> int:
+        """Convert a Tk text index ('line.char') to a character offset from '1.0'.
+
+        Uses the line-start table of original_text instead of asking Tk to
+        count characters (this runs on mouse events).
+        """
+        try:
+            line_s, _, col_s = str(index).partition(".")
+            line = int(line_s)
+            col = int(col_s or 0)
+        except ValueError:
+            return 0
+        starts = self._line_starts
+        if line < 1:
+            return 0
+        if line >= len(starts):
+            return starts[-1] - 1
+        off = starts[line - 1]
+        if self._tk_astral_extra and col:
+            # Tk columns -> characters, only for lines with non-BMP chars
+            ln = (self.original_text or "")[off:starts[line] - 1]
+            if not ln.isascii() and _ASTRAL_RE.search(ln):
+                units = 0
+                for i, ch in enumerate(ln):
+                    if units >= col:
+                        col = i
+                        break
+                    units += 2 if ch > "\uffff" else 1
+                else:
+                    col = len(ln)
+        return max(0, min(off + col, starts[line] - 1))
+
+    def _tk_index(self, offset: int) -> str:
+        """Character offset in original_text -> Tk 'line.col' index."""
+        starts = self._line_starts
+        line = max(0, min(bisect_right(starts, offset) - 1, len(starts) - 2))
+        head = (self.original_text or "")[starts[line]:offset]
+        return f"{line + 1}.{_tk_width(head, self._tk_astral_extra)}"
+
+    def _rebuild_line_starts(self):
+        starts = [0]
+        acc = 0
+        for ln in (self.original_text or "").split("\n"):
+            acc += len(ln) + 1
+            starts.append(acc)
+        self._line_starts = starts
 
     # ======================================================================
     # Actions
@@ -474,6 +857,38 @@ class MaskingApp(ctk.CTk):
     def _set_status(self, s: str):
         self.status_left.configure(text=f"status: {s}")
 
+    def _toast(self, title: str, msg: str, ms: int = 3000):
+        """Non-blocking notice at the window's bottom-right corner.
+
+        Unlike messagebox.showinfo it does not wait for a click, so the
+        event loop (log polling, the next save) keeps running. Closes after
+        `ms` or when clicked; a new toast replaces the previous one.
+        """
+        self._close_toast()
+        win = ctk.CTkToplevel(self)
+        win.title(title)
+        win.transient(self)
+        win.resizable(False, False)
+        body = ctk.CTkLabel(win, text=msg, justify="left", anchor="w")
+        body.pack(padx=16, pady=12, fill="both", expand=True)
+        # a toplevel's bindings also fire for clicks on its children
+        win.bind("<Button-1>", lambda e: self._close_toast())
+        win.update_idletasks()
+        x = self.winfo_rootx() + self.winfo_width() - win.winfo_reqwidth() - 24
+        y = self.winfo_rooty() + self.winfo_height() - win.winfo_reqheight() - 48
+        win.geometry(f"+{max(0, x)}+{max(0, y)}")
+        self._toast_win = win
+        # timer lives on the app, not on the toast, and is cancelled with it
+        self._toast_after = self.after(ms, self._close_toast)
+
+    def _close_toast(self):
+        if self._toast_after is not None:
+            self.after_cancel(self._toast_after)
+            self._toast_after = None
+        win, self._toast_win = self._toast_win, None
+        if win is not None and win.winfo_exists():
+            win.destroy()
+
     def _open_file(self):
         p = filedialog.askopenfilename(
             filetypes=[("文書", "*.docx *.pdf *.txt"), ("All", "*.*")],
@@ -489,15 +904,24 @@ class MaskingApp(ctk.CTk):
         if not self.last_result or not self.original_text:
             messagebox.showinfo("info", "先に「解析」を実行してください")
             return
-        try:
-            # GUI状態から直接レポートを生成（手動追加を確実に反映）
-            self._export_report_from_gui_state(self.last_result.out_report_html)
-            self.log_bus.emit("report regenerated from GUI state")
-        except Exception as e:
-            messagebox.showerror("error", f"レポート生成に失敗しました: {e}")
-            return
+        out_html = self.last_result.out_report_html
 
-        webbrowser.open(f"file://{os.path.abspath(self.last_result.out_report_html)}")
+        def worker():
+            import webbrowser
+            try:
+                # GUI状態から直接レポートを生成（手動追加を確実に反映）
+                self._export_report_from_gui_state(out_html)
+                self.log_bus.emit("report regenerated from GUI state")
+            except Exception as e:
+                err = e
+                self._post_ui(lambda: messagebox.showerror(
+                    "error", f"レポート生成に失敗しました: {err}"
+                ))
+                return
+            webbrowser.open(f"file://{os.path.abspath(out_html)}")
+
+        # HTML building is CPU-bound; keep it off the Tk thread
+        self._io_pool.submit(worker)
 
     def _change_mask(self, v: str):
         self.use_blackout = ("黒塗り" in (v or ""))
@@ -508,6 +932,13 @@ class MaskingApp(ctk.CTk):
         self._refresh_list()
 
     def _on_search(self):
+        # debounce: filter once typing pauses, not on every keystroke
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(120, self._do_search)
+
+    def _do_search(self):
+        self._search_after_id = None
         self.search_query = (self.search_entry.get() or "").strip()
         self._refresh_list()
 
@@ -516,31 +947,28 @@ class MaskingApp(ctk.CTk):
     # ======================================================================
 
     def _build_detections_from_payload(self, payload: Dict[str, Any]) -> List[Detection]:
-        spans = payload.get("spans", []) or []
-        review_ids = set(x.get("span_id") for x in (payload.get("review_items") or []))
-        dets: List[Detection] = []
-        for idx, s in enumerate(spans, start=1):
-            dets.append(
-                Detection(
-                    id=idx,
-                    span_id=str(s.get("span_id")),
-                    mark_id=str(s.get("mark_id")),
-                    entity_type=str(s.get("entity_type") or "UNKNOWN"),
-                    start=int(s.get("start")),
-                    end=int(s.get("end")),
-                    original=str(s.get("original") or ""),
-                    score=float(s.get("score") or 0.0),
-                    reason=str(s.get("reason") or ""),
-                    source=str(s.get("source") or "analyzer"),
-                    enabled=True,
-                    mask_override=None,
-                    is_review=(s.get("span_id") in review_ids),
-                )
-            )
-        dets.sort(key=lambda d: d.start)
-        for i, d in enumerate(dets, start=1):
-            d.id = i
-        return dets
+        # sort the spans first (stable, like sorting the detections) so ids
+        # are assigned in start order in the same pass
+        spans = sorted(payload.get("spans") or (), key=lambda s: int(s.get("start")))
+        review_ids = {x.get("span_id") for x in (payload.get("review_items") or ())}
+        _D = Detection
+        _prep = _prepare_display
+        return [
+            _prep(_D(
+                id=i,
+                span_id=str(s.get("span_id")),
+                mark_id=str(s.get("mark_id")),
+                entity_type=str(s.get("entity_type") or "UNKNOWN"),
+                start=int(s.get("start")),
+                end=int(s.get("end")),
+                original=str(s.get("original") or ""),
+                score=float(s.get("score") or 0.0),
+                reason=str(s.get("reason") or ""),
+                source=str(s.get("source") or "analyzer"),
+                is_review=(s.get("span_id") in review_ids),
+            ))
+            for i, s in enumerate(spans, start=1)
+        ]
 
     # ======================================================================
     # Run / Re-run
@@ -571,8 +999,10 @@ class MaskingApp(ctk.CTk):
             return
 
         def worker():
+            from report.report_exporter import export_html_side_by_side
+            from report.ui_payload import load_json, build_review_payload, save_json
             try:
-                self.after(0, lambda: self._set_status("processing..."))
+                self._post_ui(lambda: self._set_status("processing..."))
                 self.log_bus.emit("=== start processing ===")
 
                 # reflect mask mode
@@ -634,10 +1064,16 @@ class MaskingApp(ctk.CTk):
                     if res is not None:
                         self.last_result = res
                         self.original_text = res.original_text
+                    self._rebuild_line_starts()
                     self.payload = payload
                     self.masked_text = payload.get("masked_text", "")
                     self.report = {}
                     self.detections = self._build_detections_from_payload(payload)
+                    self._next_det_id = len(self.detections) + 1
+                    self._det_version += 1
+                    self._repl_version += 1
+                    self._rebuild_det_index()
+                    self._reset_search_index()
                     total = payload.get("summary", {}).get("total_hits", 0)
                     rev = payload.get("summary", {}).get("review_hits", 0)
                     self.status_right.configure(text=f"hits={total} / review={rev}")
@@ -646,11 +1082,11 @@ class MaskingApp(ctk.CTk):
                     self._set_status(f"解析完了（{total}件検出, {rev}件要確認）— 編集後「確定保存」で出力")
                     self.log_bus.emit(f"解析完了: {total} hits, {rev} review items")
 
-                self.after(0, apply)
+                self._post_ui(apply)
             except Exception as e:
                 err_msg = str(e)
-                self.after(0, lambda: self._set_status("error"))
-                self.after(0, lambda m=err_msg: messagebox.showerror("error", m))
+                self._post_ui(lambda: self._set_status("error"))
+                self._post_ui(lambda m=err_msg: messagebox.showerror("error", m))
                 self.log_bus.emit(f"ERROR: {err_msg}")
 
         threading.Thread(target=worker, daemon=True).start()
@@ -687,7 +1123,7 @@ class MaskingApp(ctk.CTk):
         def worker():
             import shutil
             try:
-                self.after(0, lambda: self._set_status("確定出力中..."))
+                self._post_ui(lambda: self._set_status("確定出力中..."))
                 self.log_bus.emit("=== 確定保存開始 ===")
 
                 # 1) エンジンにGUI上の編集状態を反映
@@ -709,62 +1145,72 @@ class MaskingApp(ctk.CTk):
                 self.log_bus.emit("  pipeline running...")
                 res = self.controller.process_file(self.current_file)
 
+                save_dir = os.path.dirname(os.path.abspath(save_path))
+                save_base = os.path.basename(save_path)
+                report_html_path = os.path.join(save_dir, f"report_{save_base}.html")
+                csv_out_path = os.path.join(save_dir, f"hits_{save_base}.csv")
+
                 # 3) マスキング済みファイルを保存先へ出力
-                if ext == ".docx":
-                    # GUI上で手動追加したマスクも含め、画面の確定状態をそのままDOCXへ反映する
-                    self._export_docx_from_gui_state(self.current_file, save_path)
-                    self.log_bus.emit(f"  masked file (GUI state) → {save_path}")
+                def masked_task():
+                    if ext == ".docx":
+                        # GUI上で手動追加したマスクも含め、画面の確定状態をそのままDOCXへ反映する
+                        self._export_docx_from_gui_state(self.current_file, save_path)
+                        self.log_bus.emit(f"  masked file (GUI state) → {save_path}")
+                    else:
+                        shutil.copy2(res.out_masked_path, save_path)
+                        self.log_bus.emit(f"  masked file → {save_path}")
 
-                    # output/ 側の masked もGUI状態で上書きして同期（exe配布後の一貫性向上）
+                # output/ 側の masked もGUI状態で上書きして同期（exe配布後の一貫性向上）
+                def masked_sync_task():
                     try:
                         self._export_docx_from_gui_state(self.current_file, res.out_masked_path)
                         self.log_bus.emit(f"  masked file (sync output/) → {res.out_masked_path}")
                     except Exception as _e:
                         self.log_bus.emit(f"  WARNING: output/ masked sync skipped: {_e}")
-                else:
-                    shutil.copy2(res.out_masked_path, save_path)
-                    self.log_bus.emit(f"  masked file → {save_path}")
 
                 # 4) HTMLレポート・CSVを保存先と同じフォルダに出力
-                save_dir = os.path.dirname(os.path.abspath(save_path))
-                save_base = os.path.basename(save_path)
-                report_html_path = os.path.join(save_dir, f"report_{save_base}.html")
-                csv_out_path = os.path.join(save_dir, f"hits_{save_base}.csv")
+                #    HTMLレポートはGUI状態から直接生成（手動追加を確実に反映）
+                def report_task():
+                    self._export_report_from_gui_state(report_html_path)
+                    self.log_bus.emit(f"  report → {report_html_path}")
 
-                # HTMLレポートはGUI状態から直接生成（手動追加を確実に反映）
-                self._export_report_from_gui_state(report_html_path)
-                self.log_bus.emit(f"  report → {report_html_path}")
+                # output/ 内のレポートも同期更新
+                def report_sync_task():
+                    self._export_report_from_gui_state(res.out_report_html)
 
                 # CSVもGUI状態から書き出す（手動追加/KEEP変更を確実に反映）
-                try:
-                    import csv as _csv
-                    dets = sorted([d for d in self.detections if d.enabled], key=lambda d: d.start)
-                    with open(csv_out_path, "w", encoding="utf-8-sig", newline="") as f:
-                        w = _csv.writer(f)
-                        w.writerow(["entity_type", "start", "end", "original", "replacement", "score", "reason", "source"])
-                        for d in dets:
-                            w.writerow([
-                                d.entity_type, int(d.start), int(d.end),
-                                d.original, self._replacement_for(d),
-                                float(d.score or 0.0), d.reason, d.source
-                            ])
-                    self.log_bus.emit(f"  CSV (GUI state) → {csv_out_path}")
-
-                    # output/ 側のCSVも同期（存在すれば上書き）
+                def csv_task():
                     try:
-                        shutil.copy2(csv_out_path, res.out_csv_path)
-                    except Exception:
-                        pass
-                except Exception as e:
-                    # フォールバック: パイプライン出力をコピー
-                    if os.path.exists(res.out_csv_path):
-                        shutil.copy2(res.out_csv_path, csv_out_path)
-                        self.log_bus.emit(f"  CSV → {csv_out_path}")
-                    else:
-                        self.log_bus.emit(f"  CSV export skipped: {e}")
-
-                # output/ 内のレポートも同期更新
-                self._export_report_from_gui_state(res.out_report_html)
+                        self._write_csv_from_gui_state(csv_out_path)
+                        self.log_bus.emit(f"  CSV (GUI state) → {csv_out_path}")
+
+                        # output/ 側のCSVも同期（存在すれば上書き）
+                        try:
+                            shutil.copy2(csv_out_path, res.out_csv_path)
+                        except Exception:
+                            pass
+                    except Exception as e:
+                        # フォールバック: パイプライン出力をコピー
+                        if os.path.exists(res.out_csv_path):
+                            shutil.copy2(res.out_csv_path, csv_out_path)
+                            self.log_bus.emit(f"  CSV → {csv_out_path}")
+                        else:
+                            self.log_bus.emit(f"  CSV export skipped: {e}")
+
+                # 各出力は別ファイルなので I/O プールで並行に書く。
+                # 保存先が output/ 側と同じファイルなら同期は不要（同じファイルを
+                # 2 スレッドで同時に書くと壊れる）
+                tasks = [masked_task, report_task, csv_task]
+                if not _same_path(report_html_path, res.out_report_html):
+                    tasks.append(report_sync_task)
+                if ext == ".docx" and not _same_path(save_path, res.out_masked_path):
+                    tasks.append(masked_sync_task)
+                futures = [self._io_pool.submit(t) for t in tasks]
+                wait(futures)
+                for fut in futures:
+                    err = fut.exception()
+                    if err is not None:
+                        raise err
 
                 abs_save = os.path.abspath(save_path)
                 abs_report = os.path.abspath(report_html_path)
@@ -774,42 +1220,61 @@ class MaskingApp(ctk.CTk):
                     self.last_result = res
                     self._set_status(f"確定保存完了: {os.path.basename(save_path)}")
                     self.log_bus.emit("=== 確定保存完了 ===")
-                    messagebox.showinfo(
+                    # paths are also in the log; long enough to read them
+                    self._toast(
                         "確定保存完了",
                         f"マスキング済みファイル:\n  {abs_save}\n\n"
                         f"レポート (HTML):\n  {abs_report}\n\n"
                         f"検出一覧 (CSV):\n  {abs_csv}",
+                        ms=6000,
                     )
 
-                self.after(0, done)
+                self._post_ui(done)
             except Exception as e:
                 err_msg = str(e)
-                self.after(0, lambda: self._set_status("保存エラー"))
-                self.after(0, lambda m=err_msg: messagebox.showerror("error", m))
+                self._post_ui(lambda: self._set_status("保存エラー"))
+                self._post_ui(lambda m=err_msg: messagebox.showerror("error", m))
                 self.log_bus.emit(f"ERROR: {err_msg}")
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _write_csv_from_gui_state(self, out_csv_path: str) -> None:
+        """GUI上の検出状態（有効なもの）を検出一覧CSVに書き出す。"""
+        import csv as _csv
+        dets = self._enabled_detections()
+        repl = self._replacement_for
+        rows = [
+            (d.entity_type, int(d.start), int(d.end), d.original,
+             repl(d), float(d.score or 0.0), d.reason, d.source)
+            for d in dets
+        ]
+        with open(out_csv_path, "w", encoding="utf-8-sig", newline="") as f:
+            w = _csv.writer(f)
+            w.writerow(["entity_type", "start", "end", "original", "replacement", "score", "reason", "source"])
+            w.writerows(rows)
+
     def _export_report_from_gui_state(self, out_html_path: str) -> None:
         """GUI上の検出状態からHTMLレポートを生成する。
 
         エンジン再実行ではなく self.detections を直接参照するため、
         手動追加やKEEP/MASKの変更が確実に反映される。
         """
+        from report.report_exporter import export_html_side_by_side
         txt = self.original_text or ""
-        dets = sorted(
-            [d for d in self.detections if d.enabled],
-            key=lambda d: d.start,
-        )
+        dets = self._enabled_detections()
         hits: List[Dict[str, Any]] = []
-        parts: List[str] = []
+        # pre-sized: gap + replacement per detection, then the tail; slots
+        # left over by skipped overlaps stay "" and join to nothing
+        parts: List[str] = [""] * (2 * len(dets) + 1)
+        i = 0
         cur = 0
         for d in dets:
             if d.start < cur:
                 continue
-            parts.append(txt[cur:d.start])
+            parts[i] = txt[cur:d.start]
             repl = self._replacement_for(d)
-            parts.append(repl)
+            parts[i + 1] = repl
+            i += 2
             hits.append({
                 "start": d.start, "end": d.end,
                 "entity_type": d.entity_type,
@@ -817,7 +1282,7 @@ class MaskingApp(ctk.CTk):
                 "score": d.score, "reason": d.reason, "source": d.source,
             })
             cur = d.end
-        parts.append(txt[cur:])
+        parts[i] = txt[cur:]
         masked_text = "".join(parts)
 
         warnings = []
@@ -855,7 +1320,9 @@ class MaskingApp(ctk.CTk):
         docx_segments のセグメントマップに対して置換を適用して保存する。
         """
         from pipelines.docx_segments import extract_docx_segments
-        from pipelines.docx_pipeline import map_hit_to_segments, _piece_replacement
+        from pipelines.docx_pipeline import (
+            map_hit_to_segments, segment_starts, _piece_replacement,
+        )
         from pipelines.docx_rewrite import rewrite_docx_with_maps
 
         original_text, segments, docx_warnings = extract_docx_segments(src_docx_path)
@@ -864,7 +1331,7 @@ class MaskingApp(ctk.CTk):
         if (self.original_text or "") and (self.original_text != original_text):
             self.log_bus.emit("WARNING: original_text mismatch between GUI and DOCX extraction. Export may be inaccurate.")
 
-        dets = sorted([d for d in self.detections if d.enabled], key=lambda d: d.start)
+        dets = self._enabled_detections()
 
         # GUIの置換文字列を使って hits を構築（reportと同じロジック）
         hits = []
@@ -880,8 +1347,9 @@ class MaskingApp(ctk.CTk):
             })
 
         docx_maps = []
+        seg_starts = segment_starts(segments)
         for h in hits:
-            maps = map_hit_to_segments(h, segments)
+            maps = map_hit_to_segments(h, segments, seg_starts)
             if not maps:
                 continue
             repl = h.get("replacement", "")
@@ -900,19 +1368,39 @@ class MaskingApp(ctk.CTk):
     # Runtime overrides
     # ======================================================================
 
+    def _enabled_detections(self) -> List[Detection]:
+        """Enabled detections in start order, shared by the render, export
+        and CSV passes (do not mutate); cached until _det_version changes."""
+        # version read first: a change while sorting only makes it stale
+        v = self._det_version
+        cached = self._enabled_cache
+        if cached[0] == v:
+            return cached[1]
+        dets = sorted((d for d in self.detections if d.enabled), key=lambda d: d.start)
+        self._enabled_cache = (v, dets)
+        return dets
+
     def _collect_runtime_overrides(
         self,
     ) -> Tuple[List[str], List[Dict[str, Any]], List[Dict[str, int]]]:
-        keep_spans = [
-            {"start": d.start, "end": d.end}
-            for d in self.detections
-            if not d.enabled
-        ]
+        # re-run followed by save without edits collects the same overrides
+        cached = self._overrides_cache
+        if cached[0] == self._det_version:
+            return cached[1], cached[2], cached[3]
+        result = self._build_overrides()
+        self._overrides_cache = (self._det_version, *result)
+        return result
+
+    def _build_overrides(
+        self,
+    ) -> Tuple[List[str], List[Dict[str, Any]], List[Dict[str, int]]]:
+        # one pass: disabled -> keep span, enabled forced/overridden -> mask
+        keep_spans: List[Dict[str, int]] = []
         forced_masks: List[Dict[str, Any]] = []
         for d in self.detections:
             if not d.enabled:
-                continue
-            if d.source == "forced" or d.mask_override:
+                keep_spans.append({"start": d.start, "end": d.end})
+            elif d.source == "forced" or d.mask_override:
                 forced_masks.append({
                     "start": d.start,
                     "end": d.end,
@@ -928,12 +1416,14 @@ class MaskingApp(ctk.CTk):
     # ======================================================================
 
     def _on_detection_action(self, d: Detection, action: str):
+        from policy.policy_update import apply_user_actions
+        self._det_version += 1
         audit_path = os.path.join(BASE_DIR, "audit_log.jsonl")
 
         if action == "KEEP_ONCE":
             d.enabled = False
             self.log_bus.emit(f"KEEP_ONCE: {_short(d.original, 20)}")
-            append_audit_log(audit_path, {
+            self._audit({
                 "action": "KEEP_ONCE",
                 "entity_type": d.entity_type,
                 "original": d.original,
@@ -944,7 +1434,7 @@ class MaskingApp(ctk.CTk):
             d.enabled = True
             d.source = "forced"
             self.log_bus.emit(f"MASK_ONCE: {_short(d.original, 20)}")
-            append_audit_log(audit_path, {
+            self._audit({
                 "action": "MASK_ONCE",
                 "entity_type": d.entity_type,
                 "original": d.original,
@@ -955,6 +1445,7 @@ class MaskingApp(ctk.CTk):
             d.enabled = False
             # YAML allowlist に永続追加
             try:
+                self._flush_audit()
                 result = apply_user_actions(
                     policy_yaml_path=self.policy_path,
                     spans=[{
@@ -986,7 +1477,10 @@ class MaskingApp(ctk.CTk):
             d.enabled = True
             d.entity_type = "COMPANY"
             d.source = "forced"
+            _prepare_display(d)
+            self._reset_search_index()
             try:
+                self._flush_audit()
                 result = apply_user_actions(
                     policy_yaml_path=self.policy_path,
                     spans=[{
@@ -1031,10 +1525,12 @@ class MaskingApp(ctk.CTk):
         val = val.strip()
         d.mask_override = val if val else None
         d.enabled = True
+        self._det_version += 1
         self._render_texts()
         self._refresh_list(keep_scroll=True)
 
     def _toggle_changed(self):
+        self._det_version += 1
         self._render_texts()
 
     # ======================================================================
@@ -1101,27 +1597,9 @@ class MaskingApp(ctk.CTk):
             if not sel or idx_e <= idx_s:
                 return
 
+            # the menu entries are static (built in _create_ui); they act on
+            # the range stored here
             self._ctx_range = (idx_s, idx_e, sel)
-
-            self.context_menu.delete(0, "end")
-            categories = [
-                ("👤 氏名", "PERSON"),
-                ("🏢 法人名", "COMPANY"),
-                ("🏠 住所", "ADDRESS"),
-                ("🆔 ID/番号", "ID"),
-                ("📧 メール", "EMAIL"),
-                ("📞 電話", "PHONE"),
-                ("📅 日付", "DATE"),
-                ("💰 金額", "MONEY"),
-                ("🏷️ 任意", "CUSTOM"),
-            ]
-            for lbl, ent in categories:
-                self.context_menu.add_command(
-                    label=lbl,
-                    command=lambda e=ent: self._quick_add_range(e),
-                )
-            self.context_menu.add_separator()
-            self.context_menu.add_command(label="➕ 詳細設定…", command=self._manual_add)
             # tk_popup handles focus/grab correctly on Windows
             # (post requires an extra click to activate the menu)
             self.context_menu.tk_popup(event.x_root, event.y_root)
@@ -1151,21 +1629,14 @@ class MaskingApp(ctk.CTk):
             return (0, 0, "")
 
         pos = max(0, min(pos, len(txt) - 1))
-        stop_chars = set(
-            " \t\r\n　,，.。．、:：;；()（）[]【】{}「」『』<>＜＞\"'""''|｜/／\\\\'・"
-        )
-
-        s = pos
-        e = pos
-
-        if s < len(txt) and txt[s] in stop_chars and s > 0:
-            s -= 1
-            e = s
 
-        while s > 0 and txt[s - 1] not in stop_chars and (pos - s) < 80:
-            s -= 1
-        while e < len(txt) and txt[e] not in stop_chars and (e - pos) < 80:
-            e += 1
+        at = pos
+        if at > 0 and txt[at] in _TOKEN_STOP_CHARS:
+            # clicked on a stop character: anchor on the one before it
+            at -= 1
+        # extend both ways over non-stop characters, at most 80 from pos
+        s = _TOKEN_TAIL_RE.search(txt, max(0, pos - _TOKEN_MAX_REACH), at).start()
+        e = _TOKEN_RUN_RE.match(txt, at, min(len(txt), pos + _TOKEN_MAX_REACH)).end()
 
         token = txt[s:e].strip()
         if not token:
@@ -1174,7 +1645,7 @@ class MaskingApp(ctk.CTk):
         # reflect selection in textbox
         try:
             self.o_text._textbox.tag_remove("sel", "1.0", "end")
-            self.o_text._textbox.tag_add("sel", f"1.0 + {s}c", f"1.0 + {e}c")
+            self.o_text._textbox.tag_add("sel", self._tk_index(s), self._tk_index(e))
         except Exception:
             pass
         return (s, e, token)
@@ -1252,21 +1723,24 @@ class MaskingApp(ctk.CTk):
                     sel0 = (sel0 + t).strip()
                     break
 
-        # avoid duplicate
+        # avoid duplicate (only detections starting at idx_s can match)
         span_key = (entity.upper(), idx_s, idx_e)
+        lo = bisect_left(self._det_starts, idx_s)
+        hi = bisect_right(self._det_starts, idx_s, lo)
         existing = next(
-            (d for d in self.detections
+            (d for d in self._det_order[lo:hi]
              if (d.entity_type.upper(), d.start, d.end) == span_key and d.source == "forced"),
             None,
         )
         if existing:
             existing.enabled = True
+            self._det_version += 1
             self._render_texts()
             self._refresh_list(keep_scroll=True)
             return
 
         new = Detection(
-            id=999999,
+            id=self._next_det_id,
             span_id=f"manual_{idx_s}_{idx_e}",
             mark_id=f"manual_{idx_s}_{idx_e}",
             entity_type=entity.upper(),
@@ -1280,133 +1754,240 @@ class MaskingApp(ctk.CTk):
             mask_override=None,
             is_review=False,
         )
-        self.detections.append(new)
-        self.detections.sort(key=lambda d: (d.start, -d.end))
-        for i, d in enumerate(self.detections, start=1):
-            d.id = i
+        self._next_det_id += 1
+        _prepare_display(new)
+        insort(self.detections, new, key=lambda d: (d.start, -d.end))
+        # same insert into the position index (after equal starts, like the
+        # stable sort in _rebuild_det_index)
+        i = bisect_right(self._det_starts, new.start)
+        self._det_starts.insert(i, new.start)
+        self._det_order.insert(i, new)
+        self._det_by_id[new.id] = new
+        self._det_version += 1
+        self._reset_search_index()
         self._render_texts()
         self._refresh_list(keep_scroll=True)
         self.log_bus.emit(f"manual add: {entity} '{_short(sel0, 20)}' [{idx_s}:{idx_e}]")
 
-        # audit
-        append_audit_log(
-            os.path.join(BASE_DIR, "audit_log.jsonl"),
-            {
-                "action": "manual_add",
-                "entity_type": entity,
-                "original": sel0,
-                "start": idx_s, "end": idx_e,
-            },
-        )
+        self._audit({
+            "action": "manual_add",
+            "entity_type": entity,
+            "original": sel0,
+            "start": idx_s, "end": idx_e,
+        })
+
+    def _flush_audit(self):
+        """Write out queued audit records.
+
+        apply_user_actions appends to audit_log.jsonl directly; flushing
+        first keeps the file in action order.
+        """
+        if self.controller is not None:
+            self.controller.audit.flush()
+
+    def _audit(self, payload: dict):
+        """Queue one audit record without blocking the Tk thread.
+
+        Goes through the controller's AuditLogWriter (file kept open,
+        records batched by its flush thread); before the backend is up,
+        falls back to a direct append.
+        """
+        if self.controller is not None:
+            self.controller.audit.append(payload)
+            return
+        from policy.audit_log import append_audit_log
+        append_audit_log(os.path.join(BASE_DIR, "audit_log.jsonl"), payload)
 
     # ======================================================================
     # Render
     # ======================================================================
 
     def _replacement_for(self, d: Detection) -> str:
+        key = (self._repl_version, self.use_blackout, d.entity_type, d.mask_override)
+        memo = d._repl_memo
+        if memo[0] == key:
+            return memo[1]
+        v = self._compute_replacement(d)
+        d._repl_memo = (key, v)
+        return v
+
+    def _compute_replacement(self, d: Detection) -> str:
         if d.mask_override and not self.use_blackout:
             return d.mask_override
         if self.use_blackout:
+            from engine.masking_engine import BLACK_CHAR
             return BLACK_CHAR * max(3, len(d.original))
         return f"[{d.entity_type}]"
 
     def _render_texts(self):
-        self.o_text.delete("1.0", "end")
-        self.o_text.insert("1.0", self.original_text or "")
-
-        # build masked with tags per detection
-        self.m_text.delete("1.0", "end")
-        self.m_text.tag_remove("highlight", "1.0", "end")
-        for tag in list(self.m_text.tag_names()):
-            if tag.startswith("det_"):
-                self.m_text.tag_delete(tag)
-
         txt = self.original_text or ""
-        dets = [d for d in self.detections if d.enabled]
-        dets.sort(key=lambda d: d.start)
+        dets = self._enabled_detections()
+
+        # everything the two panes depend on; unchanged -> nothing to redo
+        key = (
+            txt,
+            self.use_blackout,
+            tuple((d.id, d.start, d.end, d.entity_type, d.mask_override) for d in dets),
+        )
+        last = self._render_cache_key
+        if key == last:
+            return
+        self._render_cache_key = key
+
+        if last is None or last[0] is not txt:
+            self.o_text.configure(state="normal")
+            self.o_text.delete("1.0", "end")
+            self.o_text.insert("1.0", txt)
+            self.o_text.configure(state="disabled")
+
+        # build the masked text in one string; tag ranges are tracked as
+        # 'line.col' while appending so no Tk index lookups are needed
+        parts: List[str] = [""] * (2 * len(dets) + 1)  # see _export_report_from_gui_state
+        i = 0
+        ranges: List[Tuple[str, str, str]] = []
+        line, col = 1, 0
+        extra = self._tk_astral_extra
+
+        def _advance(piece: str):
+            # col is in Tk index columns, not Python characters (_tk_width)
+            nonlocal line, col
+            nl = piece.count("\n")
+            if nl:
+                line += nl
+                col = _tk_width(piece[piece.rfind("\n") + 1:], extra)
+            else:
+                col += _tk_width(piece, extra)
 
         cur = 0
         for d in dets:
             if d.start < cur:
                 continue
-            self.m_text.insert("end", txt[cur:d.start])
+            piece = txt[cur:d.start]
+            parts[i] = piece
+            _advance(piece)
             repl = self._replacement_for(d)
-            tag = f"det_{d.id}"
-            start_idx = self.m_text.index("end")
-            self.m_text.insert("end", repl)
-            end_idx = self.m_text.index("end")
-            self.m_text.tag_add(tag, start_idx, end_idx)
+            start_idx = f"{line}.{col}"
+            parts[i + 1] = repl
+            i += 2
+            _advance(repl)
+            ranges.append((f"det_{d.id}", start_idx, f"{line}.{col}"))
             cur = d.end
-        self.m_text.insert("end", txt[cur:])
+        parts[i] = txt[cur:]
+
+        self.m_text.configure(state="normal")
+        self.m_text.delete("1.0", "end")
+        old_tags = [t for t in self.m_text.tag_names() if t.startswith("det_")]
+        if old_tags:
+            self.m_text.tag_delete(*old_tags)
+        self.m_text.insert("1.0", "".join(parts))
+        self.m_text.configure(state="disabled")
+        if ranges:
+            # one Tcl script instead of one tag_add round-trip per detection
+            # (tag names and 'line.col' indices need no quoting)
+            tb = self.m_text._textbox
+            w = str(tb)
+            tb.tk.eval("\n".join(f"{w} tag add {tag} {a} {b}" for tag, a, b in ranges))
 
         # reset original highlight
         self.o_text.tag_delete("selected")
         self.o_text.tag_config("selected", underline=True)
 
+    def _rebuild_det_index(self):
+        """Index self.detections by start offset and by id; call after the
+        list is replaced or re-sorted."""
+        order = sorted(self.detections, key=lambda d: d.start)
+        self._det_order = order
+        self._det_starts = [d.start for d in order]
+        self._det_by_id = {d.id: d for d in order}
+
+    def _reset_search_index(self):
+        """Forget the last search result; call whenever detections change."""
+        self._last_filter = None
+        self._last_matches = []
+
     def _filtered_detections(self) -> List[Detection]:
-        dets = self.detections
-        if self.show_review_only:
-            dets = [d for d in dets if d.is_review]
         q = (self.search_query or "").strip().lower()
+        last = self._last_filter
+        if last is not None and last[0] == self.show_review_only and q.startswith(last[1]):
+            # typing further only narrows the previous result
+            dets = self._last_matches
+        else:
+            dets = self.detections
+            if self.show_review_only:
+                dets = [d for d in dets if d.is_review]
         if q:
-            dets = [
-                d for d in dets
-                if q in (d.entity_type or "").lower()
-                or q in (d.original or "").lower()
-                or q in (d.reason or "").lower()
-            ]
+            dets = [d for d in dets if q in d.search_text]
+        self._last_filter = (self.show_review_only, q)
+        self._last_matches = dets
         return dets
 
     def _refresh_list(self, keep_scroll: bool = False):
-        y = None
-        if keep_scroll:
-            try:
-                y = self.scroll._parent_canvas.yview()[0]
-            except Exception:
-                y = None
-
-        for w in self.scroll.winfo_children():
-            w.destroy()
-        self.det_items = {}
-
-        dets = self._filtered_detections()
-        if not dets:
-            ctk.CTkLabel(
-                self.scroll, text="該当なし", text_color="#546e7a",
-            ).pack(anchor="w", padx=10, pady=10)
+        self._list_dets = self._filtered_detections()
+        self._update_list_scrollregion()
+        if not keep_scroll:
+            self.list_canvas.yview_moveto(0)
+        self._render_visible(force=True)
+
+    def _update_list_scrollregion(self):
+        c = self.list_canvas
+        c.configure(scrollregion=(0, 0, c.winfo_width(), len(self._list_dets) * self.list_rows.row_height))
+
+    def _render_visible(self, force: bool = False):
+        """Draw the rows in view (plus overscan) and erase the others."""
+        c = self.list_canvas
+        rows = self.list_rows
+        dets = self._list_dets
+        n = len(dets)
+        c.itemconfigure(self._list_empty_id, state="hidden" if n else "normal")
+        if force:
+            rows.clear()
+
+        h = rows.row_height
+        top = int(c.canvasy(0))
+        first = max(0, top // h - self._list_overscan)
+        last = min(n, (top + c.winfo_height()) // h + 1 + self._list_overscan)
+
+        for i in [i for i in rows.rows if not first <= i < last]:
+            rows.erase(i)
+        width = c.winfo_width()
+        for i in range(first, last):
+            if i not in rows.rows:
+                d = dets[i]
+                rows.draw(i, d, width, d.id in self._highlighted)
+
+    def _on_list_yview(self, first, last):
+        self.list_scrollbar.set(first, last)
+        self._render_visible()
+
+    def _on_list_configure(self, event):
+        # rows are laid out for the canvas width: redraw them
+        self._update_list_scrollregion()
+        self._render_visible(force=True)
+
+    def _on_list_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif sys.platform == "darwin":
+            step = -event.delta
         else:
-            for d in dets:
-                item = DetectionListItem(
-                    self.scroll,
-                    detection=d,
-                    on_toggle=self._toggle_changed,
-                    on_select=self._select_detection,
-                    on_edit=self._edit_detection,
-                    on_hover=self._hover_from_list,
-                    on_leave=self._leave_all,
-                    on_action=self._on_detection_action,
-                )
-                item.pack(fill="x", padx=0, pady=0)
-                self.det_items[d.id] = item
-
-        if y is not None:
-            try:
-                self.scroll._parent_canvas.yview_moveto(y)
-            except Exception:
-                pass
+            step = -int(event.delta / 120)
+        if step:
+            self.list_canvas.yview_scroll(step, "units")
 
     # ======================================================================
     # Selection / highlight
     # ======================================================================
 
     def _select_detection(self, det_id: int):
-        d = next((x for x in self.detections if x.id == det_id), None)
+        d = self._det_by_id.get(det_id)
         if not d:
             return
         try:
-            self.o_text.see(f"1.0 + {d.start}c")
+            self.o_text.see(self._tk_index(d.start))
             self.o_text.tag_remove("selected", "1.0", "end")
-            self.o_text.tag_add("selected", f"1.0 + {d.start}c", f"1.0 + {d.end}c")
+            self.o_text.tag_add("selected", self._tk_index(d.start), self._tk_index(d.end))
         except Exception:
             pass
 
@@ -1415,33 +1996,56 @@ class MaskingApp(ctk.CTk):
             self.m_text.tag_add("highlight", f"det_{det_id}.first", f"det_{det_id}.last")
         except Exception:
             pass
-        if det_id in self.det_items:
-            self.det_items[det_id].set_highlight(True)
+        self._hover_det_id = det_id
+        self._highlighted.add(det_id)
+        self.list_rows.set_highlight(det_id, True)
 
     def _hover_from_list(self, det_id: int):
         try:
             self.m_text.tag_add("highlight", f"det_{det_id}.first", f"det_{det_id}.last")
         except Exception:
             pass
-        if det_id in self.det_items:
-            self.det_items[det_id].set_highlight(True)
+        self._hover_det_id = det_id
+        self._highlighted.add(det_id)
+        self.list_rows.set_highlight(det_id, True)
 
     def _leave_all(self):
+        self._hover_det_id = None
         self.m_text.tag_remove("highlight", "1.0", "end")
-        for it in self.det_items.values():
-            it.set_highlight(False)
+        for det_id in self._highlighted:
+            self.list_rows.set_highlight(det_id, False)
+        self._highlighted.clear()
 
     def _masked_hover(self, event):
+        # <Motion> fires per pixel: keep only the latest event and handle it
+        # on a short timer
+        self._hover_pending = event
+        if self._hover_after is None:
+            self._hover_after = self.after(33, self._flush_hover)
+
+    def _masked_leave(self, event=None):
+        if self._hover_after is not None:
+            self.after_cancel(self._hover_after)
+            self._hover_after = None
+        self._hover_pending = None
+        self._leave_all()
+
+    def _flush_hover(self):
+        event = self._hover_pending
+        self._hover_pending = None
+        self._hover_after = None
+        if event is None:
+            return
         try:
             idx = self.m_text._textbox.index(f"@{event.x},{event.y}")
             tags = self.m_text._textbox.tag_names(idx)
             det_tags = [t for t in tags if t.startswith("det_")]
-            if not det_tags:
-                self._leave_all()
+            det_id = int(det_tags[0].split("_")[1]) if det_tags else None
+            if det_id == self._hover_det_id:
                 return
-            det_id = int(det_tags[0].split("_")[1])
             self._leave_all()
-            self._hover_from_list(det_id)
+            if det_id is not None:
+                self._hover_from_list(det_id)
         except Exception:
             return
 
@@ -7,21 +7,44 @@ Usage:
     # GUI main thread (poll periodically):
     for msg in bus.drain():
         text_widget.insert("end", msg + "\n")
+    # ...or as one bounded blob per poll
+    blob, n = bus.drain_text(max_items=128)
+    text_widget.insert("end", blob)
+
+    # Optional: get woken up when messages arrive after an idle period
+    bus.set_notify(lambda: root.event_generate("<<LogMessage>>", when="tail"))
 """
 from __future__ import annotations
 
 import queue
 import time
-from typing import List
+from typing import Callable, List, Optional, Tuple
 
 
 class LogBus:
     def __init__(self, maxsize: int = 500):
         self._q: queue.Queue[str] = queue.Queue(maxsize=maxsize)
+        self._notify: Optional[Callable[[], None]] = None
+        # (epoch second, "HH:MM:SS"); bursts within one second share the
+        # formatted stamp. Replaced as a whole, so threads never see a torn pair
+        self._ts_cache: Tuple[int, str] = (-1, "")
+
+    def set_notify(self, fn: Optional[Callable[[], None]]) -> None:
+        """Register a callback run when a message lands in an empty queue.
+
+        Called from the emitting thread; only the first message of a burst
+        triggers it, so the consumer is woken once per burst.
+        """
+        self._notify = fn
 
     def emit(self, msg: str) -> None:
-        ts = time.strftime("%H:%M:%S")
-        line = f"[{ts}] {msg}"
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached[0] != now:
+            cached = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+            self._ts_cache = cached
+        line = f"[{cached[1]}] {msg}"
+        was_empty = self._q.empty()
         try:
             self._q.put_nowait(line)
         except queue.Full:
@@ -30,16 +53,33 @@ class LogBus:
                 self._q.put_nowait(line)
             except Exception:
                 pass
+        notify = self._notify
+        if notify is not None and was_empty:
+            try:
+                notify()
+            except Exception:
+                pass
 
-    def drain(self) -> List[str]:
+    def drain(self, max_items: Optional[int] = None) -> List[str]:
         items: List[str] = []
-        while True:
+        while max_items is None or len(items) < max_items:
             try:
                 items.append(self._q.get_nowait())
             except queue.Empty:
                 break
         return items
 
+    def drain_text(self, max_items: int = 128) -> Tuple[str, int]:
+        """Drain up to max_items messages as one newline-terminated string.
+
+        Returns (blob, count); count == max_items means more may be waiting.
+        """
+        items = self.drain(max_items)
+        if not items:
+            return "", 0
+        items.append("")
+        return "\n".join(items), len(items) - 1
+
     def clear(self) -> None:
         while not self._q.empty():
             try:
@@ -16,6 +16,12 @@ if sys.stdout is None:
 if sys.stderr is None:
     sys.stderr = open(os.devnull, "w", encoding="utf-8")
 
+# multiprocessing workers (performance.nlp_n_process) re-run this module in
+# the EXE: freeze_support() hands them off before bootstrap / GUI imports.
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # PyInstaller frozen exe support
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import os
-from typing import Tuple, Dict, Any, List
+from bisect import bisect_right
+from typing import Tuple, Dict, Any, List, Optional
 
 from .docx_segments import extract_docx_segments, Segment
 from .docx_rewrite import rewrite_docx_with_maps
@@ -15,18 +16,34 @@ def _is_black_replacement(repl: str) -> bool:
     return set(repl) == {BLACK_CHAR}
 
 
+def segment_starts(segments: List[Segment]) -> List[int]:
+    """Index for map_hit_to_segments (segments are in text order)."""
+    return [seg.global_start for seg in segments]
+
+
 def map_hit_to_segments(
-    hit: Dict[str, Any], segments: List[Segment]
+    hit: Dict[str, Any],
+    segments: List[Segment],
+    seg_starts: Optional[List[int]] = None,
 ) -> List[Dict[str, Any]]:
     """Map a global [start,end) hit to one or more DOCX segments.
 
     Previous implementation skipped hits crossing paragraph/run/cell boundaries.
     That caused UI-forced (manual) masks to be dropped at export time.
     This function returns *all* overlapping segments and provides local offsets.
+
+    Pass seg_starts (see segment_starts()) when mapping many hits: the scan
+    then starts at the segment containing the hit instead of the first one.
     """
     s, e = int(hit["start"]), int(hit["end"])
     mapped: List[Dict[str, Any]] = []
-    for seg in segments:
+    if seg_starts is not None:
+        lo = max(0, bisect_right(seg_starts, s) - 1)
+        hi = bisect_right(seg_starts, e - 1, lo) if e > s else lo
+        candidates = segments[lo:hi + 1]
+    else:
+        candidates = segments
+    for seg in candidates:
         # intersection with this segment
         os_ = max(s, seg.global_start)
         oe_ = min(e, seg.global_end)
@@ -67,11 +84,12 @@ def process_docx_file(
     report["masked_text_generated"] = masked_text
 
     docx_maps: List[Dict[str, Any]] = []
+    seg_starts = segment_starts(segments)
     for h in report.get("hits", []):
         if str(h.get("reason", "")).startswith("keep"):
             continue
 
-        maps = map_hit_to_segments(h, segments)
+        maps = map_hit_to_segments(h, segments, seg_starts)
         if not maps:
             # Should not happen, but keep traceability
             h["review_flag"] = True
@@ -1,11 +1,24 @@
 from __future__ import annotations
+import codecs
+import mmap
 import os
 import chardet
 from typing import Tuple, Dict, Any
 
 
 def _read_text_auto(path: str) -> str:
-    raw = open(path, "rb").read()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        # ファイルをマップしたまま直接デコードする（bytes への全体コピーを省く）
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 妥当な UTF-8 なら chardet（純 Python で大きなファイルほど遅い）
+            # を通さない。BOM 付きは chardet と同じく BOM を落とす
+            enc = "utf-8-sig" if mm[:3] == codecs.BOM_UTF8 else "utf-8"
+            try:
+                return str(mm, enc)
+            except UnicodeDecodeError:
+                raw = mm[:]
     det = chardet.detect(raw)
     enc = det.get("encoding") or "utf-8"
     try:
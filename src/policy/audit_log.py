@@ -1,14 +1,112 @@
 from __future__ import annotations
+import atexit
 import json
 import os
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
+from typing import Deque
+
+
+def _audit_line(payload: dict) -> str:
+    rec = dict(payload)
+    rec["ts"] = datetime.now(timezone.utc).isoformat()
+    return json.dumps(rec, ensure_ascii=False) + "\n"
 
 
 def append_audit_log(path: str, payload: dict) -> None:
     os.makedirs(
         os.path.dirname(os.path.abspath(path)), exist_ok=True
     )
-    rec = dict(payload)
-    rec["ts"] = datetime.now(timezone.utc).isoformat()
     with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        f.write(_audit_line(payload))
+
+
+class AuditLogWriter:
+    """append_audit_log の長寿命版（ファイルを開いたまま、まとめて書き込む）
+
+    レコードはメモリ上に溜め、flush_interval 秒経過・max_buffer_bytes 超過・
+    close() のいずれかで書き出す。fsync は fsync_every 件ごとと close() 時。
+    プロセス終了時は atexit で close() される。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = 0.05,
+        max_buffer_bytes: int = 1 << 20,
+        fsync_every: int = 100,
+    ):
+        os.makedirs(
+            os.path.dirname(os.path.abspath(path)), exist_ok=True
+        )
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer_bytes = max_buffer_bytes
+        self.fsync_every = max(1, int(fsync_every))
+
+        self._f = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._buf: Deque[str] = deque()
+        self._buf_bytes = 0
+        self._unsynced = 0
+        self._closed = False
+        self._wake = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append(self, payload: dict) -> None:
+        line = _audit_line(payload)
+        with self._lock:
+            if self._closed:
+                # close() 後は従来どおり 1 件ずつ追記
+                append_audit_log(self.path, payload)
+                return
+            self._buf.append(line)
+            self._buf_bytes += len(line)
+            if self._buf_bytes >= self.max_buffer_bytes:
+                self._flush_locked()
+                return
+        self._wake.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_locked(sync=True)
+            self._f.close()
+        self._wake.set()
+        atexit.unregister(self.close)
+
+    def _flush_locked(self, sync: bool = False) -> None:
+        if self._f.closed:
+            return
+        if self._buf:
+            n = len(self._buf)
+            self._f.write("".join(self._buf))
+            self._buf.clear()
+            self._buf_bytes = 0
+            self._unsynced += n
+        self._f.flush()
+        if self._unsynced and (sync or self._unsynced >= self.fsync_every):
+            os.fsync(self._f.fileno())
+            self._unsynced = 0
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            if self._closed:
+                return
+            # 短時間に続く append をまとめてから書き出す
+            time.sleep(self.flush_interval)
+            self._wake.clear()
+            self.flush()
@@ -1,13 +1,33 @@
 from __future__ import annotations
+import copy
+import os
 import yaml
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 
-def load_policy(path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=32)
+def _load_policy_cached(
+    path: str, stat_key: Tuple[int, int, int]
+) -> Dict[str, Any]:
+    # stat_key (st_ino, st_mtime_ns, st_size) only keys the cache; a
+    # rewritten file (atomic replace → new inode) is parsed again.
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
 
+def load_policy(path: str) -> Dict[str, Any]:
+    """Parse the policy YAML (cached per file version).
+
+    Returns a deep copy: callers (GUI, policy_update) mutate the dict.
+    """
+    st = os.stat(path)
+    cached = _load_policy_cached(
+        os.path.abspath(path), (st.st_ino, st.st_mtime_ns, st.st_size)
+    )
+    return copy.deepcopy(cached)
+
+
 def dump_policy(policy: Dict[str, Any]) -> str:
     return yaml.safe_dump(
         policy, allow_unicode=True, sort_keys=False
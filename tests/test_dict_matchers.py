@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("presidio_analyzer")
+
+from engine.dict_recognizer import make_dict_recognizer  # noqa: E402
+
+
+def _spans(rec, text):
+    return sorted(
+        (r.start, r.end, r.entity_type)
+        for r in rec.analyze(text, entities=[rec.supported_entities[0]])
+    )
+
+
+@pytest.mark.parametrize("use_boundaries", [True, False])
+def test_trie_matcher_agrees_with_regex_matcher(tmp_path, use_boundaries):
+    dict_path = tmp_path / "custom_companies.txt"
+    dict_path.write_text("サンプル商事\nAcme\nΣας\n", encoding="utf-8")
+    recs = {
+        m: make_dict_recognizer(
+            "COMPANY", str(dict_path), use_boundaries=use_boundaries, matcher=m
+        )
+        for m in ("trie", "regex")
+    }
+    text = "当事者：①サンプル商事、②テスト工業。Acme² and x²Acme, ΣΑΣ"
+    expected = _spans(recs["regex"], text)
+    if use_boundaries:
+        assert len(expected) == 4
+    assert _spans(recs["trie"], text) == expected
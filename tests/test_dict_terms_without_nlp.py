@@ -0,0 +1,38 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("presidio_analyzer")
+
+from engine.dict_recognizer import DictTrieRecognizer  # noqa: E402
+from engine.masking_engine import MaskingEngine  # noqa: E402
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+
+
+def _engine_with_dict(terms):
+    engine = MaskingEngine(
+        os.path.join(SRC_DIR, "resources", "masking_policy.yaml"),
+        base_dir=SRC_DIR,
+    )
+    # only the registry is used on the no-Japanese-text path
+    rec = DictTrieRecognizer(
+        "COMPANY", terms, 0.995, "CUSTOM_COMPANY_DICT", use_boundaries=True
+    )
+    engine.analyzer = SimpleNamespace(registry=SimpleNamespace(recognizers=[rec]))
+    engine.nlp_available = True
+    return engine
+
+
+def test_registered_company_masked_in_english_only_text():
+    engine = _engine_with_dict(["Acme Holdings"])
+    masked, report = engine.mask_text_with_report(
+        "This agreement is made with Acme Holdings as the supplier."
+    )
+    assert [(h["entity_type"], h["original"]) for h in report["hits"]] == [
+        ("COMPANY", "Acme Holdings")
+    ]
+    assert "Acme Holdings" not in masked
@@ -0,0 +1,48 @@
+import re
+
+import pytest
+
+regex = pytest.importorskip("regex")
+
+from engine import fast_regex  # noqa: E402
+from engine.fast_regex import FastRegexAnalyzer, _same_under_regex, default_patterns  # noqa: E402
+
+# characters on which re and `regex` disagree for \w / \s / \d
+_DIFF_CHARS = "゙²³¹\x1c\x1d\x1e\x1f\U00010d40́"
+
+CORPUS = "\n".join([
+    "連絡先゙foo@example.com",
+    "担当：山田 電話 03-1234-5678 〒100-0001",
+    "東京都千代田区丸の内一丁目1番1号",
+    "株式会社サンプル゙ と 有限会社テスト",
+    "令和5年4月1日 金100,000円 2024/4/1",
+    "甲 乙 AB12345 XYZ-12-AB3",
+    "山田 太郎",
+    "年齢：42",
+    "\n31\n男\n",
+    _DIFF_CHARS + "bar@example.org" + _DIFF_CHARS,
+]) * 3
+
+
+def test_patterns_sent_to_regex_match_like_re():
+    for p in default_patterns():
+        if not _same_under_regex(p.regex):
+            continue
+        a = [m.span() for m in re.compile(p.regex).finditer(CORPUS)]
+        b = [m.span() for m in regex.compile(p.regex).finditer(CORPUS)]
+        assert a == b, p.name
+
+
+def test_parallel_scan_equals_serial(monkeypatch):
+    serial = FastRegexAnalyzer()
+    serial.parallel_min_chars = float("inf")
+    expected = serial.analyze_tuples(CORPUS)
+
+    monkeypatch.setattr(fast_regex.os, "cpu_count", lambda: 4)
+    parallel = FastRegexAnalyzer()
+    assert parallel._pool is not None
+    parallel.parallel_min_chars = 0
+    assert parallel.analyze_tuples(CORPUS) == expected
+    assert any(
+        CORPUS[s:e] == "foo@example.com" for s, e, *_ in expected
+    )
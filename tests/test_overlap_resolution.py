@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+pytest.importorskip("presidio_analyzer")
+
+from engine.masking_engine import (  # noqa: E402
+    MaskingEngine,
+    _Candidate,
+    _max_weight_spans,
+    _resolution_spans,
+)
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+PRIORITY = {"ADDRESS": 90, "DATE": 70, "MONEY": 70}.get
+
+
+def _resolve(cands):
+    return [
+        (c.entity_type, c.start, c.end)
+        for c in _max_weight_spans(_resolution_spans(cands, PRIORITY))
+    ]
+
+
+def test_one_higher_priority_span_beats_several_lower_ones():
+    cands = [
+        _Candidate(6, 39, "ADDRESS", 0.55),
+        _Candidate(18, 27, "DATE", 0.80),
+        _Candidate(30, 38, "MONEY", 0.85),
+    ]
+    assert _resolve(cands) == [("ADDRESS", 6, 39)]
+
+
+def test_forced_beats_any_priority():
+    cands = [
+        _Candidate(0, 10, "ADDRESS", 0.9),
+        _Candidate(2, 4, "CUSTOM", 1.0, source="forced"),
+    ]
+    assert _resolve(cands) == [("CUSTOM", 2, 4)]
+
+
+def _fast_engine():
+    engine = MaskingEngine(
+        os.path.join(SRC_DIR, "resources", "masking_policy.yaml"),
+        base_dir=SRC_DIR,
+    )
+    engine.force_fast = True
+    return engine
+
+
+def test_address_not_lost_to_overlapping_date_and_money():
+    text = "本店所在地：東京都港区芝公園一丁目に2024年4月1日付で金100,000円を"
+    masked, report = _fast_engine().mask_text_with_report(text)
+    assert [h["entity_type"] for h in report["hits"]] == ["ADDRESS"]
+    assert "芝公園" not in masked
+
+
+def test_enclosing_id_not_lost_to_nested_ids():
+    text = "契約番号 ABC-1234-AB12-CD34 を参照"
+    masked, report = _fast_engine().mask_text_with_report(text)
+    assert masked == "契約番号 [ID] を参照"
+    assert [(h["start"], h["end"]) for h in report["hits"]] == [(5, 23)]
+
+
+def test_address_not_lost_to_nested_persons():
+    text = "所在地 東京都港区芝公園 担当：山田 担当：佐藤 まで"
+    masked, report = _fast_engine().mask_text_with_report(text)
+    assert [h["entity_type"] for h in report["hits"]] == ["ADDRESS"]
+    assert "芝公園" not in masked